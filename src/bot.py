@@ -9,7 +9,7 @@ from aiogram.fsm.storage.memory import MemoryStorage
 
 from core.bot import bot, start_scheduler
 from config.settings import settings
-from core.middlewares import DatabaseMiddleware, AuthMiddleware, ThrottlingMiddleware
+from core.middlewares import DatabaseMiddleware, AuthMiddleware, ThrottlingMiddleware, RequestTimeMiddleware
 from core.utils import setup_logger
 
 # Импорт роутеров
@@ -29,6 +29,8 @@ storage = MemoryStorage()
 dp = Dispatcher(storage=storage)
 
 # Регистрация middleware
+dp.message.middleware(RequestTimeMiddleware())
+dp.callback_query.middleware(RequestTimeMiddleware())
 dp.message.middleware(DatabaseMiddleware())
 dp.callback_query.middleware(DatabaseMiddleware())
 dp.message.middleware(AuthMiddleware())
@@ -49,8 +51,8 @@ async def main() -> None:
     await bot.delete_webhook(drop_pending_updates=True)
     
     # Добавляем фильтры для роутеров
-    admin_router.message.filter(F.from_user.id.in_(settings.admin_ids))
-    admin_router.callback_query.filter(F.from_user.id.in_(settings.admin_ids))
+    admin_router.message.filter(F.from_user.id.in_(settings.admin_id_set))
+    admin_router.callback_query.filter(F.from_user.id.in_(settings.admin_id_set))
     
     # Регистрация роутеров
     # Сначала регистрируем клиентский роутер
@@ -1,7 +1,8 @@
-from typing import List
+from functools import cached_property
+from typing import Tuple
 from urllib.parse import quote_plus
 
-from pydantic import SecretStr, field_validator, Field
+from pydantic import SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,8 +12,9 @@ class Settings(BaseSettings):
     """
     # Настройки бота
     bot_token: SecretStr
-    admin_ids: list[int] = Field(default_factory=list)
+    admin_ids: tuple[int, ...] = ()  # Разбирается один раз при загрузке настроек
     channel_id: str = "@ILPOavtoTON"  # Добавляем ID канала
+    debug: bool = False  # Режим отладки: ленивые загрузки связей запрещены (raiseload)
 
     # Настройки базы данных
     db_host: str = "localhost"
@@ -23,17 +25,24 @@ class Settings(BaseSettings):
 
     @field_validator("admin_ids", mode="before")
     @classmethod
-    def parse_admin_ids(cls, v: str) -> List[int]:
+    def parse_admin_ids(cls, v: str) -> Tuple[int, ...]:
         if isinstance(v, str):
             # Удаляем кавычки и разбиваем по пробелам
             v = v.strip('"').strip()
             if v.startswith("[") and v.endswith("]"):
                 # Если в формате списка [id1, id2, ...]
                 v = v[1:-1]
-                return [int(x.strip()) for x in v.split(",")]
-            return [int(x) for x in v.split()]
+                return tuple(int(x.strip()) for x in v.split(","))
+            return tuple(int(x) for x in v.split())
         return v
 
+    @cached_property
+    def admin_id_set(self) -> frozenset[int]:
+        """
+        Множество ID администраторов для быстрой проверки прав
+        """
+        return frozenset(self.admin_ids)
+
     @property
     def database_url(self) -> str:
         """
@@ -1,4 +1,5 @@
 from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from config.settings import settings
 from loguru import logger
@@ -10,8 +11,13 @@ try:
     token = settings.bot_token.get_secret_value()
     logger.info(f"Токен получен, тип: {type(token)}, длина: {len(token)}")
     
+    # Общая HTTP-сессия для всех запросов к Bot API: соединения переиспользуются,
+    # а одновременные рассылки (например, уведомления администраторам)
+    # ограничены пулом из 100 соединений. Сессия закрывается при остановке бота
+    session = AiohttpSession(limit=100, timeout=30)
+    
     # Инициализация бота
-    bot = Bot(token=token)
+    bot = Bot(token=token, session=session)
     logger.info("Бот инициализирован")
 except Exception as e:
     logger.error(f"Ошибка при инициализации бота: {e}")
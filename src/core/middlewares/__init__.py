@@ -1,9 +1,11 @@
 from .auth import AuthMiddleware
 from .database import DatabaseMiddleware
+from .request_time import RequestTimeMiddleware
 from .throttling import ThrottlingMiddleware
 
 __all__ = [
     "AuthMiddleware",
     "DatabaseMiddleware",
+    "RequestTimeMiddleware",
     "ThrottlingMiddleware"
 ] 
\ No newline at end of file
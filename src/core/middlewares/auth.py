@@ -30,7 +30,7 @@ class AuthMiddleware(BaseCustomMiddleware):
             
         if user:
             # Проверяем и обновляем статус администратора
-            is_admin = event.from_user.id in settings.admin_ids
+            is_admin = event.from_user.id in settings.admin_id_set
             if user.is_admin != is_admin:
                 user.is_admin = is_admin
                 await session.commit()
@@ -41,7 +41,7 @@ class AuthMiddleware(BaseCustomMiddleware):
                 telegram_id=event.from_user.id,
                 username=event.from_user.username,
                 full_name=event.from_user.full_name,
-                is_admin=event.from_user.id in settings.admin_ids  # Устанавливаем статус администратора
+                is_admin=event.from_user.id in settings.admin_id_set  # Устанавливаем статус администратора
             )
             session.add(user)
             await session.commit()
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram.types import TelegramObject
+
+from core.middlewares.base import BaseCustomMiddleware
+from core.utils.request_time import REQUEST_NOW
+
+
+class RequestTimeMiddleware(BaseCustomMiddleware):
+    """Middleware, фиксирующее текущее время на время обработки события"""
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """
+        Сохраняет время начала обработки, чтобы обработчики и клавиатуры
+        использовали одно и то же значение
+        :param handler: Обработчик события
+        :param event: Событие
+        :param data: Данные события
+        :return: Результат обработки
+        """
+        token = REQUEST_NOW.set(datetime.now())
+        try:
+            return await handler(event, data)
+        finally:
+            REQUEST_NOW.reset(token)
@@ -16,6 +16,8 @@ class ThrottlingMiddleware(BaseCustomMiddleware):
         """
         self.cache = TTLCache(maxsize=10000, ttl=rate_limit)
         self.rate_limit = rate_limit
+        # Ключи обработчиков с флагом "exclusive", которые сейчас выполняются
+        self.in_flight: set[str] = set()
 
     async def __call__(
         self,
@@ -35,14 +37,40 @@ class ThrottlingMiddleware(BaseCustomMiddleware):
             return await handler(event, data)
 
         if throttling_key in self.cache:
-            if isinstance(event, types.Message):
-                await event.answer(
-                    "Пожалуйста, подождите немного перед следующим запросом 🙏"
-                )
+            await self._answer_throttled(event)
             return None
 
         self.cache[throttling_key] = None
-        return await handler(event, data)
+
+        # Обработчики с флагом "exclusive" не запускаются повторно для того же
+        # пользователя, пока не завершится предыдущий вызов
+        if not get_flag(data, "exclusive"):
+            return await handler(event, data)
+
+        exclusive_key = f"{throttling_key}_{getattr(event, 'data', None)}"
+        if exclusive_key in self.in_flight:
+            await self._answer_throttled(event)
+            return None
+
+        self.in_flight.add(exclusive_key)
+        try:
+            return await handler(event, data)
+        finally:
+            self.in_flight.discard(exclusive_key)
+
+    @staticmethod
+    async def _answer_throttled(event: types.TelegramObject) -> None:
+        """
+        Сообщает пользователю, что запрос пропущен
+        :param event: Событие
+        """
+        if isinstance(event, types.Message):
+            await event.answer(
+                "Пожалуйста, подождите немного перед следующим запросом 🙏"
+            )
+        elif isinstance(event, types.CallbackQuery):
+            # Убираем индикатор загрузки на кнопке
+            await event.answer("Подождите…")
 
     @staticmethod
     def _get_throttling_key(event: types.TelegramObject) -> str | None:
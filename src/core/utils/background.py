@@ -0,0 +1,39 @@
+"""
+Модуль для запуска фоновых задач из обработчиков
+"""
+
+import asyncio
+from typing import Any, Coroutine
+
+from loguru import logger
+
+# Ссылки на запущенные задачи, чтобы сборщик мусора не удалил их до завершения
+_background_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    Запускает корутину в фоне, не дожидаясь ее завершения
+
+    Args:
+        coro: Корутина для выполнения
+
+    Returns:
+        asyncio.Task: Созданная задача
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
+
+
+def _on_task_done(task: asyncio.Task) -> None:
+    """
+    Убирает завершенную задачу из списка и логирует ее ошибку, если она была
+    """
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.opt(exception=error).error("Ошибка в фоновой задаче: {}", error)
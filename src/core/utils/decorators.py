@@ -16,7 +16,7 @@ def admin_only(func: Callable) -> Callable:
     @wraps(func)
     async def wrapper(message: Message, session: AsyncSession, *args: Any, **kwargs: Any) -> Any:
         # Проверяем, является ли пользователь администратором
-        if message.from_user.id in settings.admin_ids:
+        if message.from_user.id in settings.admin_id_set:
             return await func(message, session, *args, **kwargs)
         
         await message.answer("У вас нет прав для выполнения этой команды.")
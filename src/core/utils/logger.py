@@ -29,5 +29,5 @@ def log_error(error: Any) -> None:
     Логирование ошибок
     :param error: Объект ошибки
     """
-    logger.error(f"Error: {error}")
+    logger.error("Error: {}", error)
     logger.exception(error) 
\ No newline at end of file
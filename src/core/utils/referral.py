@@ -13,6 +13,10 @@ from aiogram.enums.parse_mode import ParseMode
 
 from database.models import User
 
+# Начало реферальной ссылки с именем бота; имя бота не меняется
+# за время работы процесса, поэтому вычисляется один раз
+_referral_link_prefix: Optional[str] = None
+
 async def generate_referral_link(user_id: int, bot: Bot) -> str:
     """
     Генерирует реферальную ссылку для пользователя
@@ -24,9 +28,12 @@ async def generate_referral_link(user_id: int, bot: Bot) -> str:
     Returns:
         str: Реферальная ссылка
     """
-    bot_info = await bot.get_me()
-    bot_username = bot_info.username
-    return f"https://t.me/{bot_username}?start=ref_{user_id}"
+    global _referral_link_prefix
+    if _referral_link_prefix is None:
+        # bot.me() кэширует ответ getMe, поэтому запрос к Telegram выполняется один раз
+        bot_info = await bot.me()
+        _referral_link_prefix = f"https://t.me/{bot_info.username}?start=ref_"
+    return f"{_referral_link_prefix}{user_id}"
 
 async def process_referral(
     user_id: int, 
@@ -0,0 +1,23 @@
+"""
+Модуль с единым текущим временем для обработки одного апдейта
+"""
+
+from contextvars import ContextVar
+from datetime import datetime
+
+# Время начала обработки апдейта, выставляется RequestTimeMiddleware
+REQUEST_NOW: ContextVar[datetime] = ContextVar("request_now")
+
+
+def request_now() -> datetime:
+    """
+    Возвращает время начала обработки текущего апдейта.
+    Вне обработчиков (например, в планировщике) возвращает текущее время
+
+    Returns:
+        datetime: Текущее время запроса
+    """
+    try:
+        return REQUEST_NOW.get()
+    except LookupError:
+        return datetime.now()
@@ -7,21 +7,35 @@ from loguru import logger
 from typing import Union
 import traceback
 from aiogram.enums.chat_member_status import ChatMemberStatus
+from cachetools import TTLCache
 
 # ID канала для проверки подписки
 CHANNEL_ID = "@ILPOavtoTON"  # Замените на ваш канал
 
-async def is_subscribed(user_id: int, bot: Bot) -> bool:
+# Результаты проверки подписки: (канал, ID пользователя) -> подписан ли
+_subscription_cache: TTLCache = TTLCache(maxsize=10_000, ttl=90)
+# Название канала не меняется за время работы процесса
+_channel_title: Union[str, None] = None
+
+async def is_subscribed(user_id: int, bot: Bot, use_cache: bool = True) -> bool:
     """
     Проверяет, подписан ли пользователь на канал
     
     Args:
         user_id: Telegram ID пользователя
         bot: Экземпляр бота
+        use_cache: Использовать сохраненный результат недавней проверки.
+            False — всегда запрашивать Telegram и обновить сохраненный результат
         
     Returns:
         bool: True, если пользователь подписан на канал
     """
+    cache_key = (CHANNEL_ID, user_id)
+    if use_cache:
+        cached = _subscription_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
     try:
         logger.info(f"Проверка подписки пользователя {user_id} на канал {CHANNEL_ID}")
         
@@ -34,6 +48,8 @@ async def is_subscribed(user_id: int, bot: Bot) -> bool:
         result = member.status in [ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.CREATOR]
         logger.info(f"Результат проверки подписки для пользователя {user_id}: {result}")
         
+        # Ошибки не кэшируем, чтобы следующая проверка снова обратилась к Telegram
+        _subscription_cache[cache_key] = result
         return result
     except Exception as e:
         logger.error(f"Ошибка при проверке подписки пользователя {user_id}: {e}")
@@ -51,8 +67,13 @@ async def get_channel_info(bot: Bot) -> Union[str, None]:
     Returns:
         str: Название канала или None в случае ошибки
     """
+    global _channel_title
+    if _channel_title is not None:
+        return _channel_title
+    
     try:
         chat = await bot.get_chat(chat_id=CHANNEL_ID)
+        _channel_title = chat.title
         return chat.title
     except Exception as e:
         logger.error(f"Ошибка при получении информации о канале: {e}")
@@ -3,12 +3,46 @@ from typing import Tuple, List
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.orm import selectinload
 from loguru import logger
 
 from database.models import TimeSlot, Appointment
+from keyboards.client.callbacks import RateCB
 from core.bot_instance import bot
+from core.utils.request_time import request_now
+
+# Количество дат на одной странице клавиатуры расписания (2 столбца по 3 кнопки)
+DATES_PER_PAGE = 6
+
+async def get_slot_dates_page(session: AsyncSession, page: int = 1) -> Tuple[List[Row], int, int]:
+    """
+    Получает одну страницу дат с будущими слотами и количеством слотов на каждую дату.
+    Группировка и пагинация выполняются в БД, поэтому загружаются только
+    даты текущей страницы
+    Returns: (строки (day, slots_count), номер страницы, количество страниц)
+    """
+    now = request_now()
+    day = func.date(TimeSlot.date)
+    
+    dates_count = await session.scalar(
+        select(func.count(func.distinct(day)))
+        .where(TimeSlot.date >= now)
+    )
+    total_pages = max((dates_count + DATES_PER_PAGE - 1) // DATES_PER_PAGE, 1)
+    
+    # Проверяем валидность номера страницы
+    page = min(max(page, 1), total_pages)
+    
+    result = await session.execute(
+        select(day.label("day"), func.count().label("slots_count"))
+        .where(TimeSlot.date >= now)
+        .group_by(day)
+        .order_by(day)
+        .limit(DATES_PER_PAGE)
+        .offset((page - 1) * DATES_PER_PAGE)
+    )
+    return list(result.all()), page, total_pages
 
 async def get_time_slots_view(date: datetime, session: AsyncSession) -> Tuple[str, List[List[InlineKeyboardButton]]]:
     """
@@ -241,11 +275,11 @@ async def send_completion_message(appointment: Appointment) -> None:
         # Создаем клавиатуру для оценки
         keyboard = InlineKeyboardMarkup(inline_keyboard=[
             [
-                InlineKeyboardButton(text="1⭐", callback_data=f"rate_service_{appointment.id}_1"),
-                InlineKeyboardButton(text="2⭐", callback_data=f"rate_service_{appointment.id}_2"),
-                InlineKeyboardButton(text="3⭐", callback_data=f"rate_service_{appointment.id}_3"),
-                InlineKeyboardButton(text="4⭐", callback_data=f"rate_service_{appointment.id}_4"),
-                InlineKeyboardButton(text="5⭐", callback_data=f"rate_service_{appointment.id}_5")
+                InlineKeyboardButton(text="1⭐", callback_data=RateCB(appointment_id=appointment.id, rating=1).pack()),
+                InlineKeyboardButton(text="2⭐", callback_data=RateCB(appointment_id=appointment.id, rating=2).pack()),
+                InlineKeyboardButton(text="3⭐", callback_data=RateCB(appointment_id=appointment.id, rating=3).pack()),
+                InlineKeyboardButton(text="4⭐", callback_data=RateCB(appointment_id=appointment.id, rating=4).pack()),
+                InlineKeyboardButton(text="5⭐", callback_data=RateCB(appointment_id=appointment.id, rating=5).pack())
             ]
         ])
 
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import AsyncGenerator
 
 from sqlalchemy import MetaData, BigInteger
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 
@@ -13,6 +14,10 @@ from .imports import settings
 engine = create_async_engine(
     settings.database_url,
     echo=False,  # Для отладки установите True
+    poolclass=AsyncAdaptedQueuePool,
+    # Отдаем последнее возвращенное соединение: нагрузка ложится на небольшое
+    # число "горячих" соединений, а лишние закрываются по pool_recycle
+    pool_use_lifo=True,
     pool_size=5,
     max_overflow=10,
     pool_timeout=30,
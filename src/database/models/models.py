@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import String, ForeignKey, Text, Boolean, Integer, JSON, ARRAY, BigInteger, DateTime
+from sqlalchemy import String, ForeignKey, Text, Boolean, Integer, JSON, ARRAY, BigInteger, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship, backref
 
 from ..base import Base
@@ -183,7 +183,7 @@ class Prize(Base):
     prize_name: Mapped[str] = mapped_column(String(200), nullable=False)  # Название приза
     combination: Mapped[str] = mapped_column(String(20), nullable=False)  # Выигрышная комбинация
     status: Mapped[str] = mapped_column(String(20), default="PENDING")  # PENDING, CONFIRMED, USED
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), nullable=False)  # Время БД
     confirmed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Когда админ подтвердил
     confirmed_by: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=True)  # ID администратора, подтвердившего приз
     used_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Когда приз был использован
@@ -213,7 +213,7 @@ class SlotSpin(Base):
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False)
     combination: Mapped[str] = mapped_column(String(20), nullable=False)  # Выпавшая комбинация
     result: Mapped[str] = mapped_column(String(200), nullable=False)  # Результат (приз, доп. попытка, ничего)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), nullable=False)  # Время БД
     prize_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("prizes.id"), nullable=True)  # Ссылка на приз, если был выигрыш
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)  # Устанавливаем значение по умолчанию
     
@@ -20,8 +20,8 @@ from . import (
 )
 
 # Добавляем фильтры для админских ID в основной роутер
-router.message.filter(F.from_user.id.in_(settings.admin_ids))
-router.callback_query.filter(F.from_user.id.in_(settings.admin_ids))
+router.message.filter(F.from_user.id.in_(settings.admin_id_set))
+router.callback_query.filter(F.from_user.id.in_(settings.admin_id_set))
 
 # Правильный порядок подключения роутеров:
 router.include_router(base.router)           # Базовые команды и общие обработчики
@@ -139,15 +139,15 @@ APPOINTMENT_PREFIXES = [
 
 router = Router(name='admin_appointments')
 # Добавляем фильтр для админских ID
-router.message.filter(F.from_user.id.in_(settings.admin_ids))
-router.callback_query.filter(F.from_user.id.in_(settings.admin_ids))
+router.message.filter(F.from_user.id.in_(settings.admin_id_set))
+router.callback_query.filter(F.from_user.id.in_(settings.admin_id_set))
 
 def admin_filter(message: Message | CallbackQuery) -> bool:
     """
     Фильтр для проверки прав администратора
     """
     user_id = message.from_user.id if isinstance(message, Message) else message.from_user.id
-    return user_id in settings.admin_ids
+    return user_id in settings.admin_id_set
 
 # Регистрируем обработчики состояний в основном роутере
 @router.message(AdminAppointmentStates.setting_appointment_price)
@@ -2393,7 +2393,7 @@ async def catch_all_messages(message: Message, state: FSMContext):
     Отлавливаем все сообщения, которые не попали в другие обработчики
     """
     # Проверяем, является ли пользователь админом
-    if message.from_user.id not in settings.admin_ids:
+    if message.from_user.id not in settings.admin_id_set:
         return
         
     logger.info("=================== НАЧАЛО catch_all_messages ===================")
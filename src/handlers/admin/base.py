@@ -44,9 +44,9 @@ def admin_filter(message: Message | CallbackQuery) -> bool:
     """
     user_id = message.from_user.id if isinstance(message, Message) else message.from_user.id
     print(f"Проверка прав администратора для пользователя {user_id}. Admin IDs: {settings.admin_ids}")
-    return user_id in settings.admin_ids
+    return user_id in settings.admin_id_set
 
-@router.message(Command("admin"), F.from_user.id.in_(settings.admin_ids))
+@router.message(Command("admin"), F.from_user.id.in_(settings.admin_id_set))
 async def cmd_admin(message: Message) -> None:
     """
     Обработчик команды /admin
@@ -98,7 +98,7 @@ async def show_statistics(message: Message, session: AsyncSession) -> None:
     await message.answer(stats_text, reply_markup=get_admin_keyboard(), parse_mode="HTML")
 
 # Приоритетный обработчик для панели администратора
-@router.message(F.text.regexp(r'^👨‍💼 Панель администратора$'), F.from_user.id.in_(settings.admin_ids))
+@router.message(F.text.regexp(r'^👨‍💼 Панель администратора$'), F.from_user.id.in_(settings.admin_id_set))
 async def show_admin_panel(message: Message, session: AsyncSession) -> None:
     """
     Показывает панель администратора с актуальной статистикой
@@ -261,7 +261,7 @@ async def manage_content(callback: CallbackQuery, session: AsyncSession) -> None
     finally:
         logger.info("=== КОНЕЦ manage_content в base.py ===")
 
-@router.message(Command("start"), F.from_user.id.in_(settings.admin_ids))
+@router.message(Command("start"), F.from_user.id.in_(settings.admin_id_set))
 async def cmd_start_admin(message: Message) -> None:
     """
     Обработчик команды /start для администраторов
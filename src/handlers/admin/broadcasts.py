@@ -51,7 +51,7 @@ def admin_filter(message: Message | CallbackQuery) -> bool:
     Фильтр для проверки прав администратора
     """
     user_id = message.from_user.id if isinstance(message, Message) else message.message.from_user.id
-    return user_id in settings.admin_ids
+    return user_id in settings.admin_id_set
 
 
 # Управление рассылками
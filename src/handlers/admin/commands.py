@@ -44,7 +44,7 @@ def admin_filter(message: Message | CallbackQuery) -> bool:
     Фильтр для проверки прав администратора
     """
     user_id = message.from_user.id if isinstance(message, Message) else message.message.from_user.id
-    return user_id in settings.admin_ids
+    return user_id in settings.admin_id_set
 
 @router.message(Command("admin"), admin_filter)
 async def cmd_admin(message: Message) -> None:
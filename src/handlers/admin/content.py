@@ -48,7 +48,7 @@ def admin_filter(message: Message | CallbackQuery) -> bool:
     Фильтр для проверки прав администратора
     """
     user_id = message.from_user.id if isinstance(message, Message) else message.message.from_user.id
-    return user_id in settings.admin_ids
+    return user_id in settings.admin_id_set
 
 @router.callback_query(F.data == "manage_content", admin_filter, is_content_callback)
 async def manage_content(callback: CallbackQuery, session: AsyncSession) -> None:
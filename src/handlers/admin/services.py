@@ -14,6 +14,7 @@ from keyboards.admin.admin import get_services_management_keyboard, get_admin_in
 from states.admin import ServiceStates
 from core.utils.logger import log_error
 from core.utils.image_handler import delete_photo, save_photo_to_disk
+from handlers.client._service_cache import invalidate_services_cache
 
 router = Router(name='admin_services')
 
@@ -43,7 +44,7 @@ def admin_filter(message: Message | CallbackQuery) -> bool:
         
     logger.debug(f"Проверка прав администратора для пользователя {user_id}")
     logger.debug(f"Список администраторов: {settings.admin_ids}")
-    return user_id in settings.admin_ids
+    return user_id in settings.admin_id_set
 
 def is_service_callback(callback: CallbackQuery) -> bool:
     """
@@ -393,6 +394,7 @@ async def process_add_service_photo(message: Message, state: FSMContext, session
         new_service.image_path = image_path
         new_service.image_id = file_id
         await session.commit()
+        invalidate_services_cache()
         
         # Формируем информацию об услуге
         service_info = (
@@ -459,6 +461,7 @@ async def process_edit_name(message: Message, state: FSMContext, session: AsyncS
         
         service.name = message.text
         await session.commit()
+        invalidate_services_cache()
         
         await show_updated_service(message, service, state, session)
     except Exception as e:
@@ -483,6 +486,7 @@ async def process_edit_description(message: Message, state: FSMContext, session:
         
         service.description = message.text
         await session.commit()
+        invalidate_services_cache()
         
         await show_updated_service(message, service, state, session)
     except Exception as e:
@@ -514,6 +518,7 @@ async def process_edit_price(message: Message, state: FSMContext, session: Async
         
         service.price = int(price_text)
         await session.commit()
+        invalidate_services_cache()
         
         await show_updated_service(message, service, state, session)
     except Exception as e:
@@ -545,6 +550,7 @@ async def process_edit_duration(message: Message, state: FSMContext, session: As
         
         service.duration = int(duration_text)
         await session.commit()
+        invalidate_services_cache()
         
         await show_updated_service(message, service, state, session)
     except Exception as e:
@@ -583,6 +589,7 @@ async def process_edit_service_photo(message: Message, state: FSMContext, sessio
         service.image_path = image_path
         service.image_id = file_id
         await session.commit()
+        invalidate_services_cache()
         
         # Формируем информацию об услуге
         service_info = (
@@ -671,6 +678,7 @@ async def delete_service(callback: CallbackQuery, session: AsyncSession) -> None
                 service.image_id = None
                 
             await session.commit()
+            invalidate_services_cache()
             logger.info(f"Услуга '{service_name}' успешно архивирована")
             
             await callback.answer(
@@ -687,6 +695,7 @@ async def delete_service(callback: CallbackQuery, session: AsyncSession) -> None
             # Удаляем услугу из БД
             await session.delete(service)
             await session.commit()
+            invalidate_services_cache()
             logger.info(f"Услуга '{service_name}' полностью удалена")
             
             await callback.answer("✅ Услуга удалена!", show_alert=True)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import selectinload
 from loguru import logger
 
 from config.settings import settings
+from core.utils.request_time import request_now
 from database.models import Prize, User, SlotSpin
 from keyboards.admin.admin import get_admin_inline_keyboard
 from src.handlers.admin.appointments import STATUS_TRANSLATIONS
@@ -51,7 +52,7 @@ def admin_filter(callback: CallbackQuery) -> bool:
     """
     Фильтр для проверки прав администратора
     """
-    return callback.from_user.id in settings.admin_ids
+    return callback.from_user.id in settings.admin_id_set
 
 @router.callback_query(F.data == "admin_slot_machine_menu")
 async def manage_slot_machine(callback: CallbackQuery, session: AsyncSession) -> None:
@@ -669,7 +670,7 @@ async def view_slot_stats(callback: CallbackQuery, session: AsyncSession) -> Non
         )
         
         # Статистика за последние 24 часа
-        day_ago = datetime.now() - timedelta(days=1)
+        day_ago = request_now() - timedelta(days=1)
         spins_24h = await session.scalar(
             select(func.count(SlotSpin.id))
             .where(SlotSpin.created_at >= day_ago)
@@ -683,7 +684,7 @@ async def view_slot_stats(callback: CallbackQuery, session: AsyncSession) -> Non
         )
 
         # Статистика за последнюю неделю
-        week_ago = datetime.now() - timedelta(days=7)
+        week_ago = request_now() - timedelta(days=7)
         spins_week = await session.scalar(
             select(func.count(SlotSpin.id))
             .where(SlotSpin.created_at >= week_ago)
@@ -705,7 +706,7 @@ async def view_slot_stats(callback: CallbackQuery, session: AsyncSession) -> Non
         first_game_date = first_game_result.scalar_one_or_none()
         
         if first_game_date:
-            days_since_start = (datetime.now() - first_game_date).days
+            days_since_start = (request_now() - first_game_date).days
             avg_spins_per_day = total_spins / max(days_since_start, 1)
             avg_wins_per_day = total_wins / max(days_since_start, 1)
         else:
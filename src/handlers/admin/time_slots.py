@@ -19,7 +19,8 @@ from keyboards.admin.admin import (
 )
 from states.admin import TimeSlotStates
 from core.utils.logger import log_error
-from core.utils.time_slots import get_time_slots_view, check_and_clear_states, update_completed_appointments
+from core.utils.request_time import request_now
+from core.utils.time_slots import get_time_slots_view, check_and_clear_states, update_completed_appointments, get_slot_dates_page
 
 
 router = Router(name='admin_time_slots')
@@ -45,7 +46,7 @@ def admin_filter(message: Message | CallbackQuery) -> bool:
     Фильтр для проверки прав администратора
     """
     user_id = message.from_user.id if isinstance(message, Message) else message.from_user.id
-    return user_id in settings.admin_ids
+    return user_id in settings.admin_id_set
 
 # Добавим функцию проверки callback'ов расписания
 def is_time_slots_callback(callback: CallbackQuery) -> bool:
@@ -68,13 +69,8 @@ async def manage_schedule(callback: CallbackQuery, session: AsyncSession) -> Non
         # Сразу отвечаем на callback
         await callback.answer()
         
-        time_slots = await session.execute(
-            select(TimeSlot)
-            .where(TimeSlot.date >= datetime.now())
-            .order_by(TimeSlot.date)
-        )
-        time_slots = time_slots.scalars().all()
-        logger.debug(f"Найдено временных слотов: {len(time_slots)}")
+        dates, page, total_pages = await get_slot_dates_page(session, page=1)
+        logger.debug(f"Всего страниц с датами слотов: {total_pages}")
         
         # Создаем клавиатуру с кнопками управления
         keyboard = [
@@ -88,10 +84,10 @@ async def manage_schedule(callback: CallbackQuery, session: AsyncSession) -> Non
             )]
         ]
         
-        dates_keyboard = get_time_slots_dates_keyboard(time_slots, page=1)
+        dates_keyboard = get_time_slots_dates_keyboard(dates, page, total_pages)
         
         # Добавляем уникальный идентификатор к сообщению для предотвращения ошибки "message is not modified"
-        current_time = datetime.now().strftime("%H:%M:%S")
+        current_time = request_now().strftime("%H:%M:%S")
         
         try:
             await callback.message.edit_text(
@@ -262,7 +258,7 @@ async def start_add_slot_to_date(callback: CallbackQuery, state: FSMContext, ses
             parse_mode="HTML"
         )
 
-@router.callback_query(F.data == "add_time_slot_schedule", F.from_user.id.in_(settings.admin_ids), is_time_slots_callback)
+@router.callback_query(F.data == "add_time_slot_schedule", F.from_user.id.in_(settings.admin_id_set), is_time_slots_callback)
 async def start_add_time_slot(callback: CallbackQuery, state: FSMContext) -> None:
     """
     Начало процесса добавления временного слота
@@ -694,7 +690,7 @@ async def delete_time_slot(callback: CallbackQuery, session: AsyncSession) -> No
             reply_markup=get_admin_inline_keyboard()
         )
 
-@router.callback_query(F.data == "auto_create_slots_schedule", F.from_user.id.in_(settings.admin_ids), is_time_slots_callback)
+@router.callback_query(F.data == "auto_create_slots_schedule", F.from_user.id.in_(settings.admin_id_set), is_time_slots_callback)
 async def start_auto_create_slots(callback: CallbackQuery, state: FSMContext) -> None:
     """
     Начало процесса автоматического создания слотов
@@ -848,13 +844,8 @@ async def process_auto_month(callback: CallbackQuery, state: FSMContext, session
         # Очищаем состояние
         await state.clear()
         
-        # Получаем обновленный список слотов
-        time_slots = await session.execute(
-            select(TimeSlot)
-            .where(TimeSlot.date >= current_datetime)
-            .order_by(TimeSlot.date)
-        )
-        time_slots = time_slots.scalars().all()
+        # Получаем первую страницу дат с учетом новых слотов
+        dates, page, total_pages = await get_slot_dates_page(session)
         
         # Создаем клавиатуру с кнопками управления
         keyboard = [
@@ -869,7 +860,7 @@ async def process_auto_month(callback: CallbackQuery, state: FSMContext, session
         ]
         
         # Получаем клавиатуру с датами
-        dates_keyboard = get_time_slots_dates_keyboard(time_slots)
+        dates_keyboard = get_time_slots_dates_keyboard(dates, page, total_pages)
         
         # Формируем сообщение с результатами
         month_names = {
@@ -924,12 +915,7 @@ async def handle_date_pagination(callback: CallbackQuery, session: AsyncSession)
         logger.info(f"Администратор {callback.from_user.id} переключился на страницу {page}")
         await callback.answer()
         
-        time_slots = await session.execute(
-            select(TimeSlot)
-            .where(TimeSlot.date >= datetime.now())
-            .order_by(TimeSlot.date)
-        )
-        time_slots = time_slots.scalars().all()
+        dates, page, total_pages = await get_slot_dates_page(session, page)
         
         # Создаем клавиатуру с кнопками управления
         keyboard = [
@@ -943,7 +929,7 @@ async def handle_date_pagination(callback: CallbackQuery, session: AsyncSession)
             )]
         ]
         
-        dates_keyboard = get_time_slots_dates_keyboard(time_slots, page)
+        dates_keyboard = get_time_slots_dates_keyboard(dates, page, total_pages)
         
         await callback.message.edit_text(
             "<b>🕐 Управление расписанием</b>\n\n"
@@ -0,0 +1,112 @@
+# src/handlers/client/_service_cache.py
+
+"""
+Кэш списка услуг для клиентского меню «Услуги и цены».
+
+Каталог услуг меняется редко, поэтому список хранится в памяти процесса
+не дольше TTL секунд и сбрасывается админскими обработчиками при любом
+изменении услуг.
+"""
+
+import time
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import Service
+from keyboards.client.client import get_services_keyboard
+
+# Время жизни кэша в секундах
+TTL = 60.0
+
+# (время загрузки, строки услуг с полями id, name, price)
+_cache: tuple[float, list[Row]] | None = None
+# Услуги по ID: id -> (время загрузки, услуга)
+_by_id: dict[int, tuple[float, Service]] = {}
+# Готовая клавиатура для текущего содержимого _cache
+_keyboard: InlineKeyboardMarkup | None = None
+# Строка с кнопкой возврата в главное меню под списком услуг
+_BACK_TO_MAIN_ROW = [
+    InlineKeyboardButton(
+        text="🔙 Назад в главное меню",
+        callback_data="back_to_main"
+    )
+]
+# Версия данных: увеличивается при каждом сбросе кэша, чтобы результат
+# запроса, начатого до сброса, не попал обратно в кэш
+_version = 0
+
+
+def invalidate_services_cache() -> None:
+    """
+    Сбрасывает кэш услуг (вызывается после изменения услуг администратором)
+    """
+    global _cache, _keyboard, _version
+    _cache = None
+    _keyboard = None
+    _by_id.clear()
+    _version += 1
+
+
+async def get_services_cached(session: AsyncSession) -> list[Row]:
+    """
+    Возвращает список услуг, при необходимости перечитывая его из БД.
+    Загружаются только поля, нужные для клавиатуры: id, name и price
+    """
+    global _cache, _keyboard
+    if _cache is not None and time.monotonic() - _cache[0] < TTL:
+        return _cache[1]
+
+    version = _version
+    result = await session.execute(
+        select(Service.id, Service.name, Service.price)
+        .order_by(Service.id)
+    )
+    services = list(result.all())
+
+    if version == _version:
+        _cache = (time.monotonic(), services)
+        _keyboard = None
+    return services
+
+
+async def get_service_cached(session: AsyncSession, service_id: int) -> Service | None:
+    """
+    Возвращает услугу по ID, при необходимости загружая ее из БД.
+    Возвращаемый объект используется только для чтения
+    """
+    cached = _by_id.get(service_id)
+    if cached is not None and time.monotonic() - cached[0] < TTL:
+        return cached[1]
+
+    version = _version
+    service = await session.get(Service, service_id)
+
+    if service is not None and version == _version:
+        _by_id[service_id] = (time.monotonic(), service)
+    return service
+
+
+async def get_services_keyboard_cached(session: AsyncSession) -> InlineKeyboardMarkup | None:
+    """
+    Возвращает клавиатуру со списком услуг и кнопкой возврата в главное меню.
+    Если услуг нет, возвращает None
+    """
+    global _keyboard
+    services = await get_services_cached(session)
+    if not services:
+        return None
+
+    if _keyboard is not None and _cache is not None and _cache[1] is services:
+        return _keyboard
+
+    # Создаем клавиатуру с услугами
+    keyboard = get_services_keyboard(services)
+
+    # Добавляем кнопку возврата в главное меню
+    keyboard.inline_keyboard.append(_BACK_TO_MAIN_ROW)
+
+    if _cache is not None and _cache[1] is services:
+        _keyboard = keyboard
+    return keyboard
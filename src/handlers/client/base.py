@@ -22,7 +22,7 @@ router = Router()
 # Паттерн для извлечения ID реферера из deep link
 REFERRAL_PATTERN = r"ref_(\d+)"
 
-@router.message(CommandStart(), ~F.from_user.id.in_(settings.admin_ids))
+@router.message(CommandStart(), ~F.from_user.id.in_(settings.admin_id_set))
 async def cmd_start(message: Message, session: AsyncSession, user: User, state: FSMContext, bot: Bot, command: CommandStart) -> None:
     """
     Единый обработчик команды /start для обычных пользователей
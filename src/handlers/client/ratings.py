@@ -1,76 +1,116 @@
+import re
+
 from aiogram import Router, F
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import CallbackQuery
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 from loguru import logger
 
+from config.settings import settings
 from database.models import Appointment
+from keyboards.client.callbacks import RateCB
 from core.bot_instance import bot
+from core.utils.background import run_in_background
 
 router = Router()
 
+# Старый формат callback_data: rate_service_<id записи>_<оценка>
+_RATE_RE = re.compile(r"rate_service_(\d+)_(\d+)")
+
+# Сообщение с благодарностью за оценку
+_THANK_YOU_TEXT = (
+    "🙏 Спасибо за вашу оценку!\n\n"
+    "Мы очень ценим ваше мнение и постоянно работаем над улучшением качества наших услуг.\n"
+    "Будем рады видеть вас снова! 😊"
+)
+_RATING_ERROR_TEXT = "Произошла ошибка при сохранении оценки"
+
+# Связи записи, которые используются при обработке оценки.
+# В режиме отладки любая другая (ленивая) загрузка вызывает исключение
+_APPOINTMENT_LOAD_OPTIONS = [
+    joinedload(Appointment.user),
+    joinedload(Appointment.service),
+    joinedload(Appointment.time_slot)
+]
+if settings.debug:
+    _APPOINTMENT_LOAD_OPTIONS.append(raiseload("*"))
+
+@router.callback_query(RateCB.filter())
+# Старый формат callback_data остается у ранее отправленных сообщений
 @router.callback_query(F.data.startswith("rate_service_"))
-async def handle_service_rating(callback: CallbackQuery, session: AsyncSession):
+async def handle_service_rating(callback: CallbackQuery, session: AsyncSession, callback_data: RateCB | None = None):
     """
     Обрабатывает оценку услуги от клиента
     """
+    # Получаем ID записи и оценку из callback_data
+    if callback_data is not None:
+        appointment_id, rating = callback_data.appointment_id, callback_data.rating
+    else:
+        match = _RATE_RE.fullmatch(callback.data)
+        if match is None:
+            logger.error("Некорректные данные оценки: {}", callback.data)
+            await callback.answer(_RATING_ERROR_TEXT, show_alert=True)
+            return
+        appointment_id, rating = int(match[1]), int(match[2])
+    
     try:
-        # Получаем ID записи и оценку из callback_data
-        parts = callback.data.split("_")
-        appointment_id = int(parts[2])
-        rating = int(parts[3])
-        
         # Получаем запись из базы данных со связанными объектами
-        result = await session.execute(
-            select(Appointment)
-            .where(Appointment.id == appointment_id)
-            .options(
-                selectinload(Appointment.user),
-                selectinload(Appointment.service),
-                selectinload(Appointment.time_slot)
-            )
+        appointment = await session.get(
+            Appointment,
+            appointment_id,
+            options=_APPOINTMENT_LOAD_OPTIONS
         )
-        appointment = result.scalar_one_or_none()
         
-        if not appointment:
-            await callback.answer("Запись не найдена", show_alert=True)
-            return
+        if appointment:
+            # Формируем уведомление администраторам до обращений к БД и Telegram
+            date_str = appointment.time_slot.date.strftime('%d.%m.%Y %H:%M')
+            admin_notification = (
+                f"⭐ Новая оценка от клиента!\n\n"
+                f"👤 Клиент: {appointment.user.full_name}\n"
+                f"💇‍♂️ Услуга: {appointment.service.name}\n"
+                f"📅 Дата: {date_str}\n"
+                f"⭐ Оценка: {rating}/5"
+            )
             
-        # Сохраняем оценку
-        appointment.rating = rating
-        await session.commit()
-        
-        # Отправляем сообщение с благодарностью за оценку
-        thank_you_text = (
-            f"🙏 Спасибо за вашу оценку!\n\n"
-            f"Мы очень ценим ваше мнение и постоянно работаем над улучшением качества наших услуг.\n"
-            f"Будем рады видеть вас снова! 😊"
-        )
-        
+            # Сохраняем оценку
+            appointment.rating = rating
+            await session.commit()
+    except SQLAlchemyError as e:
+        logger.error("Ошибка при сохранении оценки: {}", e)
+        await callback.answer(_RATING_ERROR_TEXT, show_alert=True)
+        return
+    
+    if not appointment:
+        await callback.answer("Запись не найдена", show_alert=True)
+        return
+    
+    # Возвращаем соединение в пул до обращений к Telegram: дальше
+    # используются только уже загруженные данные
+    await session.close()
+    
+    try:
         # Редактируем исходное сообщение
         await callback.message.edit_text(
-            text=thank_you_text,
+            text=_THANK_YOU_TEXT,
             reply_markup=None  # Убираем клавиатуру с оценками
         )
-        
-        # Уведомляем администратора о новой оценке
-        admin_notification = (
-            f"⭐ Новая оценка от клиента!\n\n"
-            f"👤 Клиент: {appointment.user.full_name}\n"
-            f"💇‍♂️ Услуга: {appointment.service.name}\n"
-            f"📅 Дата: {appointment.time_slot.date.strftime('%d.%m.%Y %H:%M')}\n"
-            f"⭐ Оценка: {rating}/5"
-        )
-        
-        # Отправляем уведомление всем администраторам
-        from config.settings import settings
-        for admin_id in settings.admin_ids:
-            try:
-                await bot.send_message(admin_id, admin_notification)
-            except Exception as e:
-                logger.error(f"Ошибка при отправке уведомления администратору {admin_id}: {e}")
-        
-    except Exception as e:
-        logger.error(f"Ошибка при обработке оценки: {e}")
-        await callback.answer("Произошла ошибка при сохранении оценки", show_alert=True) 
\ No newline at end of file
+    except TelegramBadRequest as e:
+        # Оценка уже сохранена, поэтому просто подтверждаем ее всплывающим сообщением
+        logger.error("Не удалось обновить сообщение с оценкой: {}", e)
+        await callback.answer(_THANK_YOU_TEXT, show_alert=True)
+    
+    # Отправляем уведомление всем администраторам в фоне,
+    # чтобы не задерживать ответ пользователю
+    run_in_background(_notify_admins(admin_notification))
+
+async def _notify_admins(admin_notification: str) -> None:
+    """
+    Отправляет уведомление о новой оценке всем администраторам
+    """
+    for admin_id in settings.admin_ids:
+        try:
+            await bot.send_message(admin_id, admin_notification)
+        except Exception as e:
+            logger.error("Ошибка при отправке уведомления администратору {}: {}", admin_id, e)
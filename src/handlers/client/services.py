@@ -1,65 +1,92 @@
 # src/handlers/client/services.py
 
+import asyncio
+from functools import partial, singledispatch
+from typing import Any, Awaitable, Callable
+
 from aiogram import Router, F, Bot
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 from loguru import logger
 
 from config.settings import settings
-from database.models import Service, User, PriceRequest
-from keyboards.client.client import get_main_keyboard, get_services_keyboard
+from database.models import User, PriceRequest
+from keyboards.client.client import get_main_keyboard
+from keyboards.client.callbacks import PriceCB, ServiceCB
 from states.client import ServiceStates
 from core.utils.logger import log_error
+from core.utils.background import run_in_background
+from handlers.client._service_cache import get_service_cached, get_services_keyboard_cached
 
 router = Router()
 
+# В режиме отладки любая ленивая загрузка связей пользователя вызывает исключение
+_USER_LOAD_OPTIONS = [raiseload("*")] if settings.debug else []
+
+# Текст меню услуг в HTML (не зависит от запроса, собирается один раз)
+_SERVICES_HEADER_HTML = (
+    "<b>🚘 Услуги и цены</b>\n\n"
+    "<b>⚠️ Обратите внимание:</b> указанные цены являются ориентировочными.\n"
+    "<b>Для получения точной стоимости, пожалуйста:</b>\n"
+    "1️⃣ <code>Выберите интересующую услугу</code>\n"
+    "2️⃣ <code>В сообщении укажите марку и модель вашего автомобиля</code>\n"
+    "3️⃣ <code>Получите точный расчет (в течение 15 минут)</code>\n\n"
+    "<b>Доступные услуги:</b>\n\n"
+)
+_SERVICES_ERROR_TEXT = "❌ Произошла ошибка при загрузке списка услуг"
+_EMPTY_SERVICES_TEXT = (
+    "❌ К сожалению, список услуг пока пуст.\n"
+    "Пожалуйста, попробуйте позже."
+)
+
+# Неизменяемые клавиатуры, общие для всех запросов
+_BACK_TO_MAIN_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="🔙 Главное меню", callback_data="back_to_main")]
+])
+_BACK_TO_SERVICES_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="↩️ Назад", callback_data="services_and_prices")]
+])
+# Клавиатура с вопросом о дополнительных вопросах по услуге
+_QUESTION_CHOICE_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(
+            text="✏️ Да, есть вопрос",
+            callback_data="add_question"
+        ),
+        InlineKeyboardButton(
+            text="➡️ Нет, отправить",
+            callback_data="send_request"
+        )
+    ]
+])
+
+async def _build_services_view(session: AsyncSession) -> tuple[str, InlineKeyboardMarkup] | None:
+    """
+    Возвращает текст и клавиатуру меню услуг или None, если услуг нет.
+    Клавиатура берется из кэша, если он актуален
+    """
+    keyboard = await get_services_keyboard_cached(session)
+    if keyboard is None:
+        return None
+    return _SERVICES_HEADER_HTML, keyboard
+
 @router.message(F.text == "💰 Услуги и цены")
 async def show_services_command(message: Message, session: AsyncSession) -> None:
     """
     Показывает список услуг и цен (обработчик текстовой команды)
     """
     try:
-        logger.info(f"Пользователь {message.from_user.id} открыл список услуг")
+        logger.info("Пользователь {} открыл список услуг", message.from_user.id)
         
-        # Получаем все услуги из БД
-        services = await session.execute(
-            select(Service)
-            .order_by(Service.id)
-        )
-        services = services.scalars().all()
-        
-        if not services:
-            await message.answer(
-                "❌ К сожалению, список услуг пока пуст.\n"
-                "Пожалуйста, попробуйте позже.",
-                reply_markup=get_main_keyboard()
-            )
+        view = await _build_services_view(session)
+        if view is None:
+            await message.answer(_EMPTY_SERVICES_TEXT, reply_markup=get_main_keyboard())
             return
         
-        # Формируем текст со списком услуг в HTML
-        message_text = (
-            "<b>🚘 Услуги и цены</b>\n\n"
-            "<b>⚠️ Обратите внимание:</b> указанные цены являются ориентировочными.\n"
-            "<b>Для получения точной стоимости, пожалуйста:</b>\n"
-            "1️⃣ <code>Выберите интересующую услугу</code>\n"
-            "2️⃣ <code>В сообщении укажите марку и модель вашего автомобиля</code>\n" 
-            "3️⃣ <code>Получите точный расчет (в течение 15 минут)</code>\n\n"
-            "<b>Доступные услуги:</b>\n\n"
-        )
-        
-        # Создаем клавиатуру с услугами
-        keyboard = get_services_keyboard(services)
-        
-        # Добавляем кнопку возврата в главное меню
-        keyboard.inline_keyboard.append([
-            InlineKeyboardButton(
-                text="🔙 Назад в главное меню",
-                callback_data="back_to_main"
-            )
-        ])
-        
+        message_text, keyboard = view
         await message.answer(
             message_text,
             reply_markup=keyboard,
@@ -69,7 +96,7 @@ async def show_services_command(message: Message, session: AsyncSession) -> None
     except Exception as e:
         log_error(e)
         await message.answer(
-            "❌ Произошла ошибка при загрузке списка услуг",
+            _SERVICES_ERROR_TEXT,
             reply_markup=get_main_keyboard()
         )
 
@@ -79,69 +106,43 @@ async def show_services(callback: CallbackQuery, session: AsyncSession, state: F
     Показывает список услуг и цен
     """
     try:
-        logger.info(f"Пользователь {callback.from_user.id} открыл список услуг")
+        logger.info("Пользователь {} открыл список услуг", callback.from_user.id)
         await callback.answer()
         
-        # Получаем все услуги из БД
-        services = await session.execute(
-            select(Service)
-            .order_by(Service.id)
-        )
-        services = services.scalars().all()
-        
-        if not services:
-            await callback.message.answer(
-                "❌ К сожалению, список услуг пока пуст.\n"
-                "Пожалуйста, попробуйте позже.",
-                reply_markup=InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(text="🔙 Главное меню", callback_data="back_to_main")]
-                ])
-            )
+        view = await _build_services_view(session)
+        if view is None:
+            await callback.message.answer(_EMPTY_SERVICES_TEXT, reply_markup=_BACK_TO_MAIN_KB)
             return
         
-        # Формируем текст со списком услуг в HTML
-        message_text = (
-            "<b>🚘 Услуги и цены</b>\n\n"
-            "<b>⚠️ Обратите внимание:</b> указанные цены являются ориентировочными.\n"
-            "<b>Для получения точной стоимости, пожалуйста:</b>\n"
-            "1️⃣ <code>Выберите интересующую услугу</code>\n"
-            "2️⃣ <code>В сообщении укажите марку и модель вашего автомобиля</code>\n" 
-            "3️⃣ <code>Получите точный расчет (в течение 15 минут)</code>\n\n"
-            "<b>Доступные услуги:</b>\n\n"
-        )
-        
-        # Создаем клавиатуру с услугами
-        keyboard = get_services_keyboard(services)
-        
-        # Добавляем кнопку возврата в главное меню
-        keyboard.inline_keyboard.append([
-            InlineKeyboardButton(
-                text="🔙 Назад в главное меню",
-                callback_data="back_to_main"
-            )
-        ])
+        message_text, keyboard = view
         
         try:
             # Пытаемся получить ID предыдущего сообщения из состояния
             data = await state.get_data()
             previous_message_id = data.get("previous_message_id")
             
-            if previous_message_id:
-                try:
-                    # Пытаемся удалить предыдущее сообщение
-                    await callback.message.bot.delete_message(
-                        callback.message.chat.id,
-                        previous_message_id
-                    )
-                except Exception as e:
-                    logger.error(f"Не удалось удалить предыдущее сообщение: {e}")
-            
-            # Пробуем отредактировать текущее сообщение
-            edited_message = await callback.message.edit_text(
+            # Удаление предыдущего сообщения и редактирование текущего
+            # не зависят друг от друга, поэтому выполняем их параллельно
+            tasks = []
+            if previous_message_id and previous_message_id != callback.message.message_id:
+                tasks.append(callback.message.bot.delete_message(
+                    callback.message.chat.id,
+                    previous_message_id
+                ))
+            tasks.append(callback.message.edit_text(
                 message_text,
                 reply_markup=keyboard,
                 parse_mode="HTML"
-            )
+            ))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for result in results[:-1]:
+                if isinstance(result, Exception):
+                    logger.error("Не удалось удалить предыдущее сообщение: {}", result)
+            
+            edited_message = results[-1]
+            if isinstance(edited_message, Exception):
+                raise edited_message
             # Сохраняем ID нового сообщения
             await state.update_data(previous_message_id=edited_message.message_id)
             
@@ -160,29 +161,35 @@ async def show_services(callback: CallbackQuery, session: AsyncSession, state: F
         log_error(e)
         try:
             await callback.message.edit_text(
-                "❌ Произошла ошибка при загрузке списка услуг",
-                reply_markup=InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(text="🔙 Главное меню", callback_data="back_to_main")]
-                ])
+                _SERVICES_ERROR_TEXT,
+                reply_markup=_BACK_TO_MAIN_KB
             )
         except:
             await callback.message.answer(
-                "❌ Произошла ошибка при загрузке списка услуг",
-                reply_markup=InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(text="🔙 Главное меню", callback_data="back_to_main")]
-                ])
+                _SERVICES_ERROR_TEXT,
+                reply_markup=_BACK_TO_MAIN_KB
             )
 
+@router.callback_query(ServiceCB.filter())
+# Старый формат callback_data остается у ранее отправленных сообщений
 @router.callback_query(F.data.startswith("appointment_select_service_"))
-async def select_service(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
+async def select_service(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+    callback_data: ServiceCB | None = None
+) -> None:
     """
     Обработка выбора услуги
     """
     try:
-        service_id = int(callback.data.split("_")[3])
+        if callback_data is not None:
+            service_id = callback_data.service_id
+        else:
+            service_id = int(callback.data.removeprefix("appointment_select_service_"))
         
         # Получаем выбранную услугу
-        service = await session.get(Service, service_id)
+        service = await get_service_cached(session, service_id)
         if not service:
             await callback.answer("❌ Услуга не найдена")
             return
@@ -194,7 +201,7 @@ async def select_service(callback: CallbackQuery, state: FSMContext, session: As
         keyboard = InlineKeyboardMarkup(inline_keyboard=[
             [InlineKeyboardButton(
                 text="💰 Запросить стоимость",
-                callback_data=f"request_price_{service_id}"
+                callback_data=PriceCB(service_id=service_id).pack()
             )],
             [InlineKeyboardButton(
                 text="↩️ Назад к списку услуг",
@@ -233,23 +240,35 @@ async def select_service(callback: CallbackQuery, state: FSMContext, session: As
         log_error(e)
         await callback.message.edit_text(
             "<b>❌ Произошла ошибка при выборе услуги</b>",
-            reply_markup=InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(text="↩️ Назад", callback_data="services_and_prices")]
-            ]),
+            reply_markup=_BACK_TO_SERVICES_KB,
             parse_mode="HTML"
         )
 
 # Добавляем новый обработчик для кнопки "Запросить стоимость"
+@router.callback_query(PriceCB.filter())
+# Старый формат callback_data остается у ранее отправленных сообщений
 @router.callback_query(F.data.startswith("request_price_"))
-async def request_price(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
+async def request_price(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+    callback_data: PriceCB | None = None
+) -> None:
     """
     Обработка нажатия кнопки запроса стоимости
     """
     try:
-        service_id = int(callback.data.split("_")[2])
+        if callback_data is not None:
+            service_id = callback_data.service_id
+        else:
+            service_id = int(callback.data.removeprefix("request_price_"))
+        
+        # Получаем данные о предыдущем сообщении
+        data = await state.get_data()
+        previous_message_id = data.get("previous_message_id")
         
         # Получаем выбранную услугу
-        service = await session.get(Service, service_id)
+        service = await get_service_cached(session, service_id)
         if not service:
             await callback.answer("❌ Услуга не найдена")
             return
@@ -261,7 +280,7 @@ async def request_price(callback: CallbackQuery, state: FSMContext, session: Asy
         keyboard = InlineKeyboardMarkup(inline_keyboard=[
             [InlineKeyboardButton(
                 text="↩️ Отменить запрос",
-                callback_data=f"appointment_select_service_{service_id}"
+                callback_data=ServiceCB(service_id=service_id).pack()
             )]
         ])
         
@@ -277,55 +296,53 @@ async def request_price(callback: CallbackQuery, state: FSMContext, session: Asy
             f"<i>🆗Тойота Камри 2020</i>"
         )
 
-        # Получаем данные о предыдущем сообщении
-        data = await state.get_data()
-        previous_message_id = data.get("previous_message_id")
-
         # Отправляем новое сообщение
         if callback.message.photo:
-            new_message = await callback.message.answer_photo(
+            send_new = callback.message.answer_photo(
                 photo=callback.message.photo[-1].file_id,
                 caption=message_text,
                 reply_markup=keyboard,
                 parse_mode="HTML"
             )
         else:
-            new_message = await callback.message.answer(
+            send_new = callback.message.answer(
                 message_text,
                 reply_markup=keyboard,
                 parse_mode="HTML"
             )
 
-        # Сохраняем ID нового сообщения
-        await state.update_data(previous_message_id=new_message.message_id)
-
-        # Удаляем старые сообщения
-        try:
+        # Отправка нового сообщения и удаление старых не зависят друг от друга,
+        # поэтому выполняем их параллельно
+        tasks = [
+            send_new,
             # Удаляем сообщение с кнопкой запроса
-            await callback.message.delete()
-        except Exception as e:
+            callback.message.delete()
+        ]
+        if previous_message_id and previous_message_id != callback.message.message_id:
+            # Удаляем предыдущее сохраненное сообщение
+            tasks.append(callback.message.bot.delete_message(
+                chat_id=callback.message.chat.id,
+                message_id=previous_message_id
+            ))
+        new_message, *delete_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for result in delete_results:
             # Игнорируем ошибку, если сообщение уже удалено
-            if "message to delete not found" not in str(e).lower():
-                logger.error(f"Не удалось удалить сообщение callback: {e}")
+            if isinstance(result, Exception) and "message to delete not found" not in str(result).lower():
+                logger.error("Не удалось удалить сообщение: {}", result)
 
-        if previous_message_id:
-            try:
-                # Удаляем предыдущее сохраненное сообщение
-                await callback.message.bot.delete_message(
-                    chat_id=callback.message.chat.id,
-                    message_id=previous_message_id
-                )
-            except Exception as e:
-                # Игнорируем ошибку, если сообщение уже удалено
-                if "message to delete not found" not in str(e).lower():
-                    logger.error(f"Не удалось удалить предыдущее сообщение: {e}")
+        if isinstance(new_message, Exception):
+            raise new_message
+
+        # Сохраняем ID нового сообщения
+        await state.update_data(previous_message_id=new_message.message_id)
         
     except Exception as e:
         log_error(e)
         await callback.message.answer(
             "<b>❌ Произошла ошибка при запросе стоимости</b>",
             reply_markup=InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(text="↩️ Назад", callback_data=f"appointment_select_service_{service_id}")]
+                [InlineKeyboardButton(text="↩️ Назад", callback_data=ServiceCB(service_id=service_id).pack())]
             ]),
             parse_mode="HTML"
         )
@@ -338,7 +355,7 @@ async def process_car_info(message: Message, state: FSMContext, session: AsyncSe
     try:
         # Проверяем, не является ли пользователь ботом
         if message.from_user.username and message.from_user.username.lower().endswith('bot'):
-            logger.warning(f"Попытка создания запроса от бота: {message.from_user.username}. Запрос будет обработан, но требуется проверка логики.")
+            logger.warning("Попытка создания запроса от бота: {}. Запрос будет обработан, но требуется проверка логики.", message.from_user.username)
         
         # Получаем данные из состояния
         data = await state.get_data()
@@ -355,7 +372,7 @@ async def process_car_info(message: Message, state: FSMContext, session: AsyncSe
             return
             
         # Получаем услугу
-        service = await session.get(Service, service_id)
+        service = await get_service_cached(session, service_id)
         if not service:
             await message.answer(
                 "<b>❌ Услуга не найдена. Пожалуйста, начните процесс заново.</b>",
@@ -365,35 +382,18 @@ async def process_car_info(message: Message, state: FSMContext, session: AsyncSe
             await state.clear()
             return
         
-        # Сохраняем информацию об автомобиле в состояние
-        await state.update_data(car_info=message.text)
-        
         # Спрашиваем о дополнительных вопросах
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text="✏️ Да, есть вопрос",
-                    callback_data="add_question"
-                ),
-                InlineKeyboardButton(
-                    text="➡️ Нет, отправить",
-                    callback_data="send_request"
-                )
-            ]
-        ])
-        
         sent_message = await message.answer(
             "<b>🚗 Информация об автомобиле получена</b>\n\n"
             "<i>Есть ли у вас дополнительные вопросы по услуге?</i>",
-            reply_markup=keyboard,
+            reply_markup=_QUESTION_CHOICE_KB,
             parse_mode="HTML"
         )
         
-        # Сохраняем ID сообщения для последующего удаления
-        await state.update_data(question_message_id=sent_message.message_id)
-        
-        # Обновляем состояние
+        # Обновляем состояние и сохраняем информацию об автомобиле
+        # вместе с ID сообщения для последующего удаления
         await state.set_state(ServiceStates.waiting_for_question_choice)
+        await state.update_data(car_info=message.text, question_message_id=sent_message.message_id)
         
     except Exception as e:
         log_error(e)
@@ -439,10 +439,9 @@ async def process_additional_question(message: Message, state: FSMContext, sessi
     try:
         # Получаем данные из состояния
         data = await state.get_data()
-        car_info = data.get("car_info")
         
         # Создаем заявку с дополнительным вопросом
-        await create_price_request(message, state, session, bot, car_info, message.text)
+        await create_price_request(message, state, session, bot, data, message.text)
         
     except Exception as e:
         log_error(e)
@@ -466,7 +465,7 @@ async def send_request_without_question(callback: CallbackQuery, state: FSMConte
         
         # Создаем заявку, передавая callback вместо callback.message
         # Это позволит использовать правильный from_user (пользователя, а не бота)
-        await create_price_request(callback, state, session, bot, data["car_info"])
+        await create_price_request(callback, state, session, bot, data)
         
     except Exception as e:
         log_error(e)
@@ -476,48 +475,66 @@ async def send_request_without_question(callback: CallbackQuery, state: FSMConte
             parse_mode="HTML"
         )
 
-async def create_price_request(event, state: FSMContext, session: AsyncSession, bot: Bot, car_info: str, additional_question: str = None) -> None:
+@singledispatch
+def _get_event_context(event, bot: Bot) -> tuple[int, str | None, str, Callable[..., Awaitable[Any]]]:
+    """
+    Возвращает ID, username и полное имя пользователя, а также функцию
+    для отправки ответа в чат, из которого пришло событие
+    """
+    raise TypeError(f"Неподдерживаемый тип события: {type(event).__name__}")
+
+
+@_get_event_context.register
+def _(event: Message, bot: Bot) -> tuple[int, str | None, str, Callable[..., Awaitable[Any]]]:
+    return event.from_user.id, event.from_user.username, event.from_user.full_name, event.answer
+
+
+@_get_event_context.register
+def _(event: CallbackQuery, bot: Bot) -> tuple[int, str | None, str, Callable[..., Awaitable[Any]]]:
+    # from_user берется из callback, а не из callback.message (там был бы сам бот)
+    return (
+        event.from_user.id,
+        event.from_user.username,
+        event.from_user.full_name,
+        partial(bot.send_message, event.message.chat.id)
+    )
+
+
+async def create_price_request(event, state: FSMContext, session: AsyncSession, bot: Bot, data: dict, additional_question: str = None) -> None:
     """
     Создание заявки на расчет стоимости
     
     Args:
-        event: Может быть Message или CallbackQuery
+        event: Message или CallbackQuery
         state: FSM контекст
         session: Сессия базы данных
         bot: Экземпляр бота
-        car_info: Информация об автомобиле
+        data: Данные состояния (service_id и car_info), уже прочитанные вызывающим обработчиком
         additional_question: Дополнительный вопрос (опционально)
     """
     try:
-        data = await state.get_data()
         service_id = data.get("service_id")
+        car_info = data.get("car_info")
         
-        # Определяем, является ли event сообщением или callback
-        if hasattr(event, 'message'):
-            # Это CallbackQuery
-            user_id = event.from_user.id
-            username = event.from_user.username
-            full_name = event.from_user.full_name
-            chat_id = event.message.chat.id
-        else:
-            # Это Message
-            user_id = event.from_user.id
-            username = event.from_user.username
-            full_name = event.from_user.full_name
-            chat_id = event.chat.id
+        # Получаем данные пользователя и функцию ответа в зависимости от типа события
+        user_id, username, full_name, reply = _get_event_context(event, bot)
         
         # Логируем информацию о пользователе для отладки
-        logger.info(f"Создание запроса на расчет стоимости от пользователя: ID={user_id}, username={username}, full_name={full_name}")
+        logger.info("Создание запроса на расчет стоимости от пользователя: ID={}, username={}, full_name={}", user_id, username, full_name)
         
         # Проверяем, не является ли пользователь ботом
         is_bot = False
         if username and username.lower().endswith('bot'):
             is_bot = True
-            logger.warning(f"Попытка создания запроса от бота: {username}. Необходимо проверить логику работы.")
+            logger.warning("Попытка создания запроса от бота: {}. Необходимо проверить логику работы.", username)
         
-        # Получаем или создаем пользователя
+        # Получаем или создаем пользователя. Для уведомления администраторам
+        # нужны только колонки пользователя (phone_number — обычная колонка),
+        # связи не загружаются
         user_result = await session.execute(
-            select(User).where(User.telegram_id == user_id)
+            select(User)
+            .where(User.telegram_id == user_id)
+            .options(*_USER_LOAD_OPTIONS)
         )
         user = user_result.scalar_one_or_none()
         
@@ -528,23 +545,11 @@ async def create_price_request(event, state: FSMContext, session: AsyncSession,
                 full_name=full_name
             )
             session.add(user)
-            await session.flush()
         
         # Получаем услугу
-        service = await session.get(Service, service_id)
-        
-        # Создаем запрос на расчет стоимости
-        price_request = PriceRequest(
-            user_id=user.id,
-            service_id=service_id,
-            car_info=car_info,
-            additional_question=additional_question,
-            status="PENDING"
-        )
-        session.add(price_request)
-        await session.commit()
+        service = await get_service_cached(session, service_id)
         
-        # Отправляем подтверждение пользователю
+        # Формируем подтверждение для пользователя
         confirmation_text = (
             "<b>✅ Спасибо! Ваша заявка принята.</b>\n\n"
             f"<b>📌 Услуга:</b> <i>{service.name}</i>\n"
@@ -559,24 +564,7 @@ async def create_price_request(event, state: FSMContext, session: AsyncSession,
             "для уточнения деталей и расчета точной стоимости.</b>"
         )
         
-        # Отправляем сообщение в зависимости от типа события
-        if hasattr(event, 'message'):
-            # Это CallbackQuery
-            await bot.send_message(
-                chat_id,
-                confirmation_text,
-                reply_markup=get_main_keyboard(),
-                parse_mode="HTML"
-            )
-        else:
-            # Это Message
-            await event.answer(
-                confirmation_text,
-                reply_markup=get_main_keyboard(),
-                parse_mode="HTML"
-            )
-        
-        # Уведомляем администраторов
+        # Формируем уведомление для администраторов
         admin_message = (
             "<b>🆕 НОВЫЙ ЗАПРОС РАСЧЕТА СТОИМОСТИ</b>\n\n"
             f"<b>👤 Клиент:</b> <code>{user.full_name}</code>\n"
@@ -592,6 +580,28 @@ async def create_price_request(event, state: FSMContext, session: AsyncSession,
         if additional_question:
             admin_message += f"\n<b>❓ Вопрос клиента:</b> <i>{additional_question}</i>"
         
+        # Создаем запрос на расчет стоимости. Связь задается через объект
+        # пользователя, чтобы новый пользователь и заявка сохранились одним flush
+        price_request = PriceRequest(
+            user=user,
+            service_id=service_id,
+            car_info=car_info,
+            additional_question=additional_question,
+            status="PENDING"
+        )
+        session.add(price_request)
+        await session.commit()
+        # Возвращаем соединение в пул до обращений к Telegram: дальше
+        # используются только уже загруженные данные
+        await session.close()
+        
+        # Отправляем подтверждение пользователю
+        await reply(
+            confirmation_text,
+            reply_markup=get_main_keyboard(),
+            parse_mode="HTML"
+        )
+        
         admin_keyboard = InlineKeyboardMarkup(inline_keyboard=[
             [InlineKeyboardButton(
                 text="✏️ Ответить",
@@ -599,16 +609,9 @@ async def create_price_request(event, state: FSMContext, session: AsyncSession,
             )]
         ])
         
-        for admin_id in settings.admin_ids:
-            try:
-                await bot.send_message(
-                    admin_id,
-                    admin_message,
-                    reply_markup=admin_keyboard,
-                    parse_mode="HTML"
-                )
-            except Exception as e:
-                logger.error(f"Ошибка при отправке уведомления администратору {admin_id}: {e}")
+        # Уведомления администраторам отправляем в фоне,
+        # чтобы не задерживать ответ пользователю
+        run_in_background(_notify_admins(bot, admin_message, admin_keyboard))
         
         # Очищаем состояние
         await state.clear()
@@ -617,3 +620,18 @@ async def create_price_request(event, state: FSMContext, session: AsyncSession,
         log_error(e)
         raise e
 
+
+async def _notify_admins(bot: Bot, admin_message: str, admin_keyboard: InlineKeyboardMarkup) -> None:
+    """
+    Отправляет уведомление о новом запросе расчета стоимости всем администраторам
+    """
+    for admin_id in settings.admin_ids:
+        try:
+            await bot.send_message(
+                admin_id,
+                admin_message,
+                reply_markup=admin_keyboard,
+                parse_mode="HTML"
+            )
+        except Exception as e:
+            logger.error("Ошибка при отправке уведомления администратору {}: {}", admin_id, e)
@@ -2,14 +2,18 @@
 Обработчики для слот-машины
 """
 
-from datetime import datetime
+import asyncio
+from types import MappingProxyType
+from typing import Final, Mapping
 from aiogram import Router, F, Bot
 from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.filters import Command
 from aiogram.enums.parse_mode import ParseMode
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, update
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
 from loguru import logger
 import re
 
@@ -17,6 +21,7 @@ from database.models import User, Prize, SlotSpin
 from core.utils.slot_machine import generate_slot_combination, check_win, format_slot_result
 from core.utils.referral import generate_referral_link, get_referral_stats
 from core.utils.subscription import is_subscribed, get_channel_info, CHANNEL_ID
+from keyboards.client.callbacks import PrizePageCB, ShowPrizeCB
 from keyboards.client.slot_machine import (
     get_slot_machine_keyboard, 
     get_subscription_keyboard, 
@@ -25,11 +30,88 @@ from keyboards.client.slot_machine import (
     get_win_celebration_keyboard
 )
 from core.utils.slot_machine import animate_slot_machine
+from core.utils.background import run_in_background
 from config.settings import settings
 
 # Создаем роутер
 router = Router()
 
+# Текст меню слот-машины, заполняется через .format(attempts=...)
+_MENU_TEXT_TEMPLATE = (
+    "🎰 <b>Слот-машина ILPO-TON</b>\n\n"
+    "<i>Испытайте удачу и выиграйте ценные призы!</i>\n\n"
+    "<b>Доступно попыток:</b> {attempts}\n\n"
+    "<b>Правила:</b>\n"
+    "• 3 одинаковых символа = <b>приз</b>\n"
+    "• 2 или более 🍒 = <b>дополнительная попытка</b>\n"
+    "• Базовая попытка: <b>2 раза в день</b>\n"
+    "• Дополнительные попытки за <b>приглашенных друзей</b>"
+)
+
+# Клавиатура с единственной кнопкой возврата в меню слот-машины
+_BACK_TO_MENU_MARKUP = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_menu")]
+])
+
+# Описания статусов приза (только для чтения)
+_STATUS_INFO: Final[Mapping[str, Mapping[str, str]]] = MappingProxyType({
+    "PENDING": {
+        "emoji": "⏳",
+        "text": "Ожидает подтверждения",
+        "description": "Администратор проверяет ваш выигрыш"
+    },
+    "CONFIRMED": {
+        "emoji": "✅",
+        "text": "Подтвержден",
+        "description": "Приз готов к получению"
+    },
+    "REJECTED": {
+        "emoji": "❌",
+        "text": "Отклонен",
+        "description": "Приз не подтвержден администратором"
+    },
+    "USED": {
+        "emoji": "🎉",
+        "text": "Использован",
+        "description": "Приз был успешно получен"
+    }
+})
+_UNKNOWN_STATUS: Final[Mapping[str, str]] = MappingProxyType({
+    "emoji": "❓",
+    "text": "Неизвестный статус",
+    "description": ""
+})
+
+# Приз загружается вместе с владельцем: нужны только его Telegram ID и имя
+_PRIZE_OWNER_LOAD_OPTIONS = [
+    joinedload(Prize.user).load_only(User.telegram_id, User.full_name)
+]
+
+# Тексты результата вращения, заполняются через .format(...)
+_WIN_TEXT_TEMPLATE = (
+    "🎰 <b>Результат:</b>\n\n"
+    "{combination}\n\n"
+    "🎉 <b>Поздравляем! Вы выиграли:</b>\n"
+    "{prize}\n\n"
+    "Оставшиеся попытки: {attempts}"
+)
+_SPIN_RESULT_TEXT_TEMPLATE = (
+    "🎰 <b>Результат:</b>\n\n"
+    "{combination}\n\n"
+    "{result}\n\n"
+    "Оставшиеся попытки: {attempts}"
+)
+_ADMIN_WIN_TEXT_TEMPLATE = (
+    "🎯 <b>Новый выигрыш в слот-машине!</b>\n\n"
+    "👤 Игрок: {full_name}\n"
+    "🆔 ID: {telegram_id}\n"
+    "🎁 Приз: {prize}\n"
+    "🎰 Комбинация: {combination}"
+)
+
+# Барабаны до начала вращения
+_QUESTION_MARKS = format_slot_result(('❓', '❓', '❓'))
+
 # Обработчик команды /ref (показ реферальной ссылки)
 @router.message(Command("ref"))
 async def cmd_referral(
@@ -61,16 +143,14 @@ async def cmd_referral(
 @router.message(F.text == "🎰 Слот-машина")
 async def slot_machine_menu(
     message: Message, 
-    session: AsyncSession,
-    bot: Bot
+    bot: Bot,
+    user: User
 ):
     """
     Показывает меню слот-машины
     """
-    user_id = message.from_user.id
-    
     # Проверяем подписку на канал
-    if not await is_subscribed(user_id, bot):
+    if not await is_subscribed(message.from_user.id, bot):
         channel_name = await get_channel_info(bot) or "наш канал"
         await message.answer(
             f"❌ <b>Вы не подписаны на канал</b> {CHANNEL_ID}\n\n"
@@ -80,44 +160,28 @@ async def slot_machine_menu(
         )
         return
     
-    # Получаем пользователя из БД
-    result = await session.execute(
-        select(User).where(User.telegram_id == user_id)
-    )
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        await message.answer("Произошла ошибка. Попробуйте позже.")
-        return
-    
     # Показываем информацию о слот-машине
     await message.answer(
-        "🎰 <b>Слот-машина ILPO-TON</b>\n\n"
-        "<i>Испытайте удачу и выиграйте ценные призы!</i>\n\n"
-        f"<b>Доступно попыток:</b> {user.attempts if user else 1}\n\n"
-        "<b>Правила:</b>\n"
-        "• 3 одинаковых символа = <b>приз</b>\n"
-        "• 2 или более 🍒 = <b>дополнительная попытка</b>\n"
-        "• Базовая попытка: <b>1 раз в день</b>\n"
-        "• Дополнительные попытки за <b>приглашенных друзей</b>",
+        _MENU_TEXT_TEMPLATE.format(attempts=user.attempts),
         reply_markup=get_slot_machine_keyboard(),
         parse_mode=ParseMode.HTML
     )
 
 # Обработчик проверки подписки
-@router.callback_query(F.data == "check_subscription")
+@router.callback_query(F.data == "check_subscription", flags={"exclusive": True})
 async def check_subscription(
     callback: CallbackQuery, 
-    session: AsyncSession,
-    bot: Bot
+    bot: Bot,
+    user: User
 ):
     """
     Проверяет, подписан ли пользователь на канал
     """
     await callback.answer()
     
-    # Проверяем подписку на канал
-    if await is_subscribed(callback.from_user.id, bot):
+    # Проверяем подписку на канал без сохраненного результата:
+    # пользователь мог подписаться только что
+    if await is_subscribed(callback.from_user.id, bot, use_cache=False):
         await callback.message.edit_text(
             "✅ <b>Подписка подтверждена!</b>\n\n"
             "Теперь вы можете использовать слот-машину.",
@@ -125,22 +189,9 @@ async def check_subscription(
             parse_mode=ParseMode.HTML
         )
         
-        # Получаем пользователя из БД
-        result = await session.execute(
-            select(User).where(User.telegram_id == callback.from_user.id)
-        )
-        user = result.scalar_one_or_none()
-        
         # Показываем меню слот-машины
         await callback.message.answer(
-            "🎰 <b>Слот-машина ILPO-TON</b>\n\n"
-            "<i>Испытайте удачу и выиграйте ценные призы!</i>\n\n"
-            f"<b>Доступно попыток:</b> {user.attempts if user else 1}\n\n"
-            "<b>Правила:</b>\n"
-            "• 3 одинаковых символа = <b>приз</b>\n"
-            "• 2 или более 🍒 = <b>дополнительная попытка</b>\n"
-            "• Базовая попытка: <b>1 раз в день</b>\n"
-            "• Дополнительные попытки за <b>приглашенных друзей</b>",
+            _MENU_TEXT_TEMPLATE.format(attempts=user.attempts),
             reply_markup=get_slot_machine_keyboard(),
             parse_mode=ParseMode.HTML
         )
@@ -154,11 +205,12 @@ async def check_subscription(
         )
 
 # Обработчик запуска слот-машины
-@router.callback_query(F.data == "spin_slot")
+@router.callback_query(F.data == "spin_slot", flags={"exclusive": True})
 async def spin_slot_machine(
     callback: CallbackQuery, 
     session: AsyncSession,
-    bot: Bot
+    bot: Bot,
+    user: User
 ):
     """
     Обработчик кнопки запуска слот-машины
@@ -173,77 +225,60 @@ async def spin_slot_machine(
             )
             return
 
-        # Получаем пользователя из БД
-        result = await session.execute(
-            select(User).where(User.telegram_id == callback.from_user.id)
-        )
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            await callback.answer("❌ Ошибка: пользователь не найден", show_alert=True)
-            return
-            
-        # Проверяем количество попыток
-        if user.attempts <= 0:
-            await callback.answer("❌ У вас закончились попытки!", show_alert=True)
-            return
-            
-        # Уменьшаем количество попыток
-        user.attempts -= 1
-        await session.commit()
-        
-        # Генерируем комбинацию
+        # Генерируем комбинацию и сразу проверяем выигрыш, чтобы списать
+        # попытку и начислить дополнительные одним запросом
         combination = generate_slot_combination()
+        prize_text, extra_attempts = check_win(combination)
+        formatted = format_slot_result(combination)
         
-        # Отправляем начальное сообщение
-        initial_message = await callback.message.edit_text(
-            "🎰 Крутим барабаны...\n\n" + format_slot_result(('❓', '❓', '❓'))
+        # Атомарно уменьшаем количество попыток: условие attempts > 0
+        # не даст двум одновременным вращениям потратить одну попытку дважды
+        attempts_left = await session.scalar(
+            update(User)
+            .where(User.id == user.id, User.attempts > 0)
+            .values(attempts=User.attempts - 1 + extra_attempts)
+            .returning(User.attempts)
         )
         
-        # Запускаем анимацию
-        await animate_slot_machine(initial_message, combination)
-        
-        # Проверяем выигрыш
-        prize_text, extra_attempts = check_win(combination)
+        if attempts_left is None:
+            await callback.answer("❌ У вас закончились попытки!", show_alert=True)
+            return
         
         # Создаем запись о попытке в таблице slot_spins
         slot_spin = SlotSpin(
             user_id=user.id,
-            combination=format_slot_result(combination),
-            result=prize_text,
-            created_at=datetime.now()
+            combination=formatted,
+            result=prize_text
         )
         session.add(slot_spin)
         
-        # Если выиграли приз (не просто доп. попытку)
-        if prize_text != "Повезет в следующий раз!" and prize_text != "Дополнительная попытка":
-            # Создаем запись о призе в БД
+        # Выиграли приз (не просто доп. попытку)
+        is_prize = prize_text != "Повезет в следующий раз!" and prize_text != "Дополнительная попытка"
+        if is_prize:
+            # Создаем запись о призе в БД и связываем с ней запись о попытке
             new_prize = Prize(
                 user_id=user.id,
                 prize_name=prize_text,
-                combination=format_slot_result(combination),
-                status="PENDING",
-                created_at=datetime.now()
+                combination=formatted,
+                status="PENDING"
             )
-            session.add(new_prize)
-            await session.flush()  # Чтобы получить ID приза
-            
-            # Связываем запись о попытке с призом
-            slot_spin.prize_id = new_prize.id
-            
-            # Добавляем экстра попытки, если выиграли их
-            if extra_attempts > 0:
-                user.attempts += extra_attempts
-            
-            await session.commit()
-            
+            slot_spin.prize = new_prize
+        
+        # Сохраняем списание попытки, запись о попытке и приз одной транзакцией
+        await session.commit()
+        
+        # Отправляем начальное сообщение
+        initial_message = await callback.message.edit_text(
+            "🎰 Крутим барабаны...\n\n" + _QUESTION_MARKS
+        )
+        
+        # Запускаем анимацию
+        await animate_slot_machine(initial_message, combination)
+        
+        if is_prize:
             # Формируем текст с результатом
-            result_text = (
-                f"🎰 <b>Результат:</b>\n\n"
-                f"{format_slot_result(combination)}\n\n"
-                f"🎉 <b>Поздравляем! Вы выиграли:</b>\n"
-                f"{prize_text}\n\n"
-                f"Оставшиеся попытки: {user.attempts}"
+            result_text = _WIN_TEXT_TEMPLATE.format(
+                combination=formatted, prize=prize_text, attempts=attempts_left
             )
             
             # Отправляем сообщение с результатом и кнопкой информации о призе
@@ -254,12 +289,11 @@ async def spin_slot_machine(
             )
             
             # Уведомляем администраторов о выигрыше
-            admin_notification = (
-                f"🎯 <b>Новый выигрыш в слот-машине!</b>\n\n"
-                f"👤 Игрок: {user.full_name}\n"
-                f"🆔 ID: {user.telegram_id}\n"
-                f"🎁 Приз: {prize_text}\n"
-                f"🎰 Комбинация: {format_slot_result(combination)}"
+            admin_notification = _ADMIN_WIN_TEXT_TEMPLATE.format(
+                full_name=user.full_name,
+                telegram_id=user.telegram_id,
+                prize=prize_text,
+                combination=formatted
             )
             
             # Создаем клавиатуру для администратора
@@ -278,31 +312,13 @@ async def spin_slot_machine(
                 ]
             ])
             
-            for admin_id in settings.admin_ids:
-                try:
-                    await bot.send_message(
-                        chat_id=admin_id,
-                        text=admin_notification,
-                        reply_markup=admin_keyboard,
-                        parse_mode=ParseMode.HTML
-                    )
-                except Exception as e:
-                    logger.error(f"Ошибка при отправке уведомления администратору {admin_id}: {e}")
+            # Рассылаем уведомления в фоне, чтобы победитель сразу увидел результат
+            run_in_background(_notify_admins_about_prize(bot, admin_notification, admin_keyboard))
                     
         else:
-            # Если выиграли дополнительную попытку
-            if prize_text == "Дополнительная попытка":
-                user.attempts += extra_attempts
-            
-            # Сохраняем изменения
-            await session.commit()
-            
             # Формируем текст с результатом
-            result_text = (
-                f"🎰 <b>Результат:</b>\n\n"
-                f"{format_slot_result(combination)}\n\n"
-                f"{prize_text}\n\n"
-                f"Оставшиеся попытки: {user.attempts}"
+            result_text = _SPIN_RESULT_TEXT_TEMPLATE.format(
+                combination=formatted, result=prize_text, attempts=attempts_left
             )
             
             # Отправляем сообщение с результатом
@@ -316,55 +332,70 @@ async def spin_slot_machine(
         logger.error(f"Ошибка при вращении слот-машины: {e}", exc_info=True)
         await callback.answer("❌ Произошла ошибка при вращении слот-машины", show_alert=True)
 
+async def _notify_admins_about_prize(
+    bot: Bot,
+    admin_notification: str,
+    admin_keyboard: InlineKeyboardMarkup
+) -> None:
+    """
+    Одновременно отправляет всем администраторам уведомление о выигрыше
+    """
+    admin_ids = settings.admin_ids
+    results = await asyncio.gather(
+        *(
+            bot.send_message(
+                chat_id=admin_id,
+                text=admin_notification,
+                reply_markup=admin_keyboard,
+                parse_mode=ParseMode.HTML
+            )
+            for admin_id in admin_ids
+        ),
+        return_exceptions=True
+    )
+    for admin_id, result in zip(admin_ids, results):
+        if isinstance(result, Exception):
+            logger.error("Ошибка при отправке уведомления администратору {}: {}", admin_id, result)
+
 # Обработчик просмотра списка призов
 @router.callback_query(F.data == "my_prizes")
-@router.callback_query(F.data.startswith("prizes_page_"))
+@router.callback_query(PrizePageCB.filter())
+# Старый формат callback_data остается у ранее отправленных сообщений
+@router.callback_query(F.data.regexp(r"^prizes_page_\d+$"))
 async def show_my_prizes(
     callback: CallbackQuery, 
-    session: AsyncSession
+    session: AsyncSession,
+    user: User,
+    callback_data: PrizePageCB | None = None
 ):
     """
     Показывает список призов пользователя с пагинацией
     """
-    user_id = callback.from_user.id
-    
     # Определяем номер страницы
     page = 1
-    if callback.data.startswith("prizes_page_"):
-        page = int(callback.data.split("_")[2])
-    
-    # Получаем пользователя из БД
-    user_result = await session.execute(
-        select(User).where(User.telegram_id == user_id)
+    if callback_data is not None:
+        page = callback_data.page
+    elif callback.data.startswith("prizes_page_"):
+        page = int(callback.data.removeprefix("prizes_page_"))
+    
+    # Считаем призы пользователя (AsyncSession не допускает параллельных
+    # запросов, поэтому количество и страница запрашиваются по очереди)
+    total_prizes = await session.scalar(
+        select(func.count(Prize.id)).where(Prize.user_id == user.id)
     )
-    user = user_result.scalar_one_or_none()
-    
-    if not user:
-        await callback.answer("Произошла ошибка. Попробуйте позже.", show_alert=True)
-        return
     
-    # Получаем список призов пользователя
-    prizes_result = await session.execute(
-        select(Prize.id, Prize.prize_name, Prize.combination, Prize.status, Prize.created_at, Prize.confirmed_at, Prize.used_at, Prize.admin_comment)
-        .where(Prize.user_id == user.id)
-        .order_by(Prize.created_at.desc())
-    )
-    prizes = prizes_result.all()
-    
-    if not prizes:
+    if not total_prizes:
         await callback.message.edit_text(
             "🏆 <b>Мои призы</b>\n\n"
             "У вас пока нет выигранных призов. Попробуйте сыграть в слот-машину!",
-            reply_markup=InlineKeyboardBuilder().row(
-                InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_menu")
-            ).as_markup(),
+            reply_markup=_BACK_TO_MENU_MARKUP,
             parse_mode=ParseMode.HTML
         )
         return
     
     # Настройки пагинации
     items_per_page = 3
-    total_pages = (len(prizes) + items_per_page - 1) // items_per_page
+    total_pages = (total_prizes + items_per_page - 1) // items_per_page
     
     # Проверяем валидность номера страницы
     if page < 1:
@@ -372,12 +403,15 @@ async def show_my_prizes(
     elif page > total_pages:
         page = total_pages
     
-    # Вычисляем индексы для текущей страницы
-    start_idx = (page - 1) * items_per_page
-    end_idx = min(start_idx + items_per_page, len(prizes))
-    
-    # Получаем призы для текущей страницы
-    current_page_prizes = prizes[start_idx:end_idx]
+    # Получаем из БД только призы текущей страницы
+    prizes_result = await session.execute(
+        select(Prize.id, Prize.prize_name, Prize.status)
+        .where(Prize.user_id == user.id)
+        .order_by(Prize.created_at.desc())
+        .limit(items_per_page)
+        .offset((page - 1) * items_per_page)
+    )
+    current_page_prizes = prizes_result.all()
     
     # Формируем список призов для клавиатуры
     prizes_data = [(prize.id, prize.prize_name, prize.status) for prize in current_page_prizes]
@@ -390,7 +424,7 @@ async def show_my_prizes(
     
     if page > 1:
         pagination_row.append(
-            InlineKeyboardButton(text="◀️ Назад", callback_data=f"prizes_page_{page-1}")
+            InlineKeyboardButton(text="◀️ Назад", callback_data=PrizePageCB(page=page - 1).pack())
         )
     
     pagination_row.append(
@@ -399,7 +433,7 @@ async def show_my_prizes(
     
     if page < total_pages:
         pagination_row.append(
-            InlineKeyboardButton(text="Вперед ▶️", callback_data=f"prizes_page_{page+1}")
+            InlineKeyboardButton(text="Вперед ▶️", callback_data=PrizePageCB(page=page + 1).pack())
         )
     
     # Добавляем строку с пагинацией в клавиатуру
@@ -421,65 +455,42 @@ async def show_my_prizes(
         parse_mode=ParseMode.HTML
     )
 
+# Кнопка с номером страницы ничего не делает, просто закрываем индикатор загрузки
+@router.callback_query(F.data == "prizes_page_info")
+async def prizes_page_info(callback: CallbackQuery):
+    await callback.answer()
+
 # Обработчик просмотра информации о призе
+@router.callback_query(ShowPrizeCB.filter())
+# Старый формат callback_data остается у ранее отправленных сообщений
 @router.callback_query(F.data.startswith("show_prize_"))
 async def show_prize_info(
     callback: CallbackQuery, 
-    session: AsyncSession
+    session: AsyncSession,
+    callback_data: ShowPrizeCB | None = None
 ):
     """
     Показывает информацию о конкретном призе
     """
     # Извлекаем ID приза из callback_data
-    prize_id = int(callback.data.split("_")[2])
+    if callback_data is not None:
+        prize_id = callback_data.prize_id
+    else:
+        prize_id = int(callback.data.removeprefix("show_prize_"))
     
-    # Получаем информацию о призе
-    prize_result = await session.execute(
-        select(Prize).where(Prize.id == prize_id)
-    )
-    prize = prize_result.scalar_one_or_none()
+    # Получаем приз вместе с данными его владельца одним запросом
+    prize = await session.get(Prize, prize_id, options=_PRIZE_OWNER_LOAD_OPTIONS)
     
     if not prize:
         await callback.answer("Приз не найден.", show_alert=True)
         return
     
-    # Получаем информацию о пользователе
-    user_result = await session.execute(
-        select(User).where(User.id == prize.user_id)
-    )
-    user = user_result.scalar_one_or_none()
-    
-    if not user or user.telegram_id != callback.from_user.id:
+    if prize.user.telegram_id != callback.from_user.id:
         await callback.answer("У вас нет доступа к этому призу.", show_alert=True)
         return
     
     # Определяем статус и эмодзи
-    status_info = {
-        "PENDING": {
-            "emoji": "⏳",
-            "text": "Ожидает подтверждения",
-            "description": "Администратор проверяет ваш выигрыш"
-        },
-        "CONFIRMED": {
-            "emoji": "✅",
-            "text": "Подтвержден",
-            "description": "Приз готов к получению"
-        },
-        "REJECTED": {
-            "emoji": "❌",
-            "text": "Отклонен",
-            "description": "Приз не подтвержден администратором"
-        },
-        "USED": {
-            "emoji": "🎉",
-            "text": "Использован",
-            "description": "Приз был успешно получен"
-        }
-    }.get(prize.status, {
-        "emoji": "❓",
-        "text": "Неизвестный статус",
-        "description": ""
-    })
+    status_info = _STATUS_INFO.get(prize.status, _UNKNOWN_STATUS)
     
     # Формируем сообщение с информацией о призе
     message_text = (
@@ -524,7 +535,7 @@ async def show_prize_info(
         ])
         
         # Добавляем кнопку для отметки приза как использованного (только для админов)
-        if callback.from_user.id in settings.admin_ids:
+        if callback.from_user.id in settings.admin_id_set:
             keyboard.append([
                 InlineKeyboardButton(
                     text="🎉 Отметить как выданный",
@@ -580,11 +591,8 @@ async def cmd_confirm_prize(
         )
         return
     
-    # Получаем информацию о призе
-    prize_result = await session.execute(
-        select(Prize).where(Prize.id == prize_id)
-    )
-    prize = prize_result.scalar_one_or_none()
+    # Получаем приз вместе с данными победителя одним запросом
+    prize = await session.get(Prize, prize_id, options=_PRIZE_OWNER_LOAD_OPTIONS)
     
     if not prize:
         await message.answer(
@@ -601,29 +609,22 @@ async def cmd_confirm_prize(
         )
         return
     
-    # Получаем информацию о пользователе
-    user_result = await session.execute(
-        select(User).where(User.id == prize.user_id)
-    )
-    winner = user_result.scalar_one_or_none()
-    
-    if not winner:
-        await message.answer(
-            f"❌ <b>Ошибка:</b> Пользователь, выигравший приз, не найден.",
-            parse_mode=ParseMode.HTML
-        )
-        return
-    
     # Извлекаем комментарий администратора, если есть
     admin_comment = None
     if len(command_parts) > 2:
         admin_comment = " ".join(command_parts[2:])
     
-    # Обновляем статус приза
-    prize.status = "CONFIRMED"
-    prize.confirmed_at = datetime.now()
+    # Обновляем статус приза одним UPDATE, время подтверждения ставит БД.
+    # Загруженный объект приза не изменяется, поэтому в нем не остается
+    # просроченного атрибута, который нельзя прочитать после commit
+    values = {"status": "CONFIRMED", "confirmed_at": func.now()}
     if admin_comment:
-        prize.admin_comment = admin_comment
+        values["admin_comment"] = admin_comment
+    await session.execute(
+        update(Prize)
+        .where(Prize.id == prize.id)
+        .values(**values)
+    )
     
     await session.commit()
     
@@ -645,18 +646,18 @@ async def cmd_confirm_prize(
     
     try:
         await bot.send_message(
-            chat_id=winner.telegram_id,
+            chat_id=prize.user.telegram_id,
             text=user_notification,
             parse_mode=ParseMode.HTML
         )
         
         await message.answer(
             f"✅ <b>Приз успешно подтвержден!</b>\n\n"
-            f"Уведомление отправлено пользователю {winner.full_name}.",
+            f"Уведомление отправлено пользователю {prize.user.full_name}.",
             parse_mode=ParseMode.HTML
         )
     except Exception as e:
-        logger.error(f"Ошибка при отправке уведомления пользователю {winner.telegram_id}: {e}")
+        logger.error(f"Ошибка при отправке уведомления пользователю {prize.user.telegram_id}: {e}")
         await message.answer(
             f"⚠️ <b>Приз подтвержден, но возникла ошибка при отправке уведомления пользователю.</b>\n"
             f"Ошибка: {str(e)}",
@@ -699,11 +700,8 @@ async def cmd_notify_prize(
         )
         return
     
-    # Получаем информацию о призе
-    prize_result = await session.execute(
-        select(Prize).where(Prize.id == prize_id)
-    )
-    prize = prize_result.scalar_one_or_none()
+    # Получаем приз вместе с данными победителя одним запросом
+    prize = await session.get(Prize, prize_id, options=_PRIZE_OWNER_LOAD_OPTIONS)
     
     if not prize:
         await message.answer(
@@ -721,19 +719,6 @@ async def cmd_notify_prize(
         )
         return
     
-    # Получаем информацию о пользователе
-    user_result = await session.execute(
-        select(User).where(User.id == prize.user_id)
-    )
-    winner = user_result.scalar_one_or_none()
-    
-    if not winner:
-        await message.answer(
-            f"❌ <b>Ошибка:</b> Пользователь, выигравший приз, не найден.",
-            parse_mode=ParseMode.HTML
-        )
-        return
-    
     # Обновляем комментарий администратора
     prize.admin_comment = notification_text
     await session.commit()
@@ -750,17 +735,17 @@ async def cmd_notify_prize(
     
     try:
         await bot.send_message(
-            chat_id=winner.telegram_id,
+            chat_id=prize.user.telegram_id,
             text=user_notification,
             parse_mode=ParseMode.HTML
         )
         
         await message.answer(
-            f"✅ <b>Уведомление успешно отправлено пользователю {winner.full_name}!</b>",
+            f"✅ <b>Уведомление успешно отправлено пользователю {prize.user.full_name}!</b>",
             parse_mode=ParseMode.HTML
         )
     except Exception as e:
-        logger.error(f"Ошибка при отправке уведомления пользователю {winner.telegram_id}: {e}")
+        logger.error(f"Ошибка при отправке уведомления пользователю {prize.user.telegram_id}: {e}")
         await message.answer(
             f"⚠️ <b>Возникла ошибка при отправке уведомления пользователю.</b>\n"
             f"Ошибка: {str(e)}",
@@ -799,9 +784,7 @@ async def show_referrals(
     
     await callback.message.edit_text(
         message_text,
-        reply_markup=InlineKeyboardBuilder().row(
-            InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_menu")
-        ).as_markup(),
+        reply_markup=_BACK_TO_MENU_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -831,35 +814,20 @@ async def show_rules(callback: CallbackQuery):
     
     await callback.message.edit_text(
         message_text,
-        reply_markup=InlineKeyboardBuilder().row(
-            InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_menu")
-        ).as_markup(),
+        reply_markup=_BACK_TO_MENU_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
 # Обработчик кнопки "Назад"
 @router.callback_query(F.data == "back_to_menu")
-async def back_to_menu(callback: CallbackQuery, session: AsyncSession):
+async def back_to_menu(callback: CallbackQuery, user: User):
     """
     Возвращает пользователя в главное меню слот-машины
     """
     await callback.answer()
     
-    # Получаем пользователя из БД
-    result = await session.execute(
-        select(User).where(User.telegram_id == callback.from_user.id)
-    )
-    user = result.scalar_one_or_none()
-    
     await callback.message.edit_text(
-        "🎰 <b>Слот-машина ILPO-TON</b>\n\n"
-        "<i>Испытайте удачу и выиграйте ценные призы!</i>\n\n"
-        f"<b>Доступно попыток:</b> {user.attempts if user else 1}\n\n"
-        "<b>Правила:</b>\n"
-        "• 3 одинаковых символа = <b>приз</b>\n"
-        "• 2 или более 🍒 = <b>дополнительная попытка</b>\n"
-        "• Базовая попытка: <b>2 раза в день</b>\n"
-        "• Дополнительные попытки за <b>приглашенных друзей</b>",
+        _MENU_TEXT_TEMPLATE.format(attempts=user.attempts),
         reply_markup=get_slot_machine_keyboard(),
         parse_mode=ParseMode.HTML
     )
@@ -868,7 +836,6 @@ async def back_to_menu(callback: CallbackQuery, session: AsyncSession):
 @router.callback_query(F.data == "invite_friends")
 async def invite_friends(
     callback: CallbackQuery, 
-    session: AsyncSession,
     bot: Bot
 ):
     """
@@ -879,19 +846,6 @@ async def invite_friends(
     
     user_id = callback.from_user.id
     
-    # Получаем пользователя из БД
-    result = await session.execute(
-        select(User).where(User.telegram_id == user_id)
-    )
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        await callback.message.edit_text(
-            "❌ Произошла ошибка. Пожалуйста, попробуйте позже.",
-            reply_markup=get_slot_machine_keyboard()
-        )
-        return
-    
     # Генерируем реферальную ссылку
     ref_link = await generate_referral_link(user_id, bot)
     
@@ -924,7 +878,7 @@ async def confirm_slot_prize(callback: CallbackQuery, session: AsyncSession, bot
     """
     try:
         # Проверяем, что пользователь - администратор
-        if not user.is_admin or callback.from_user.id not in settings.admin_ids:
+        if not user.is_admin or callback.from_user.id not in settings.admin_id_set:
             logger.warning(f"Попытка подтверждения приза неадминистратором: user_id={callback.from_user.id}, is_admin={user.is_admin}")
             await callback.answer("❌ У вас нет прав для подтверждения призов", show_alert=True)
             return
@@ -932,59 +886,55 @@ async def confirm_slot_prize(callback: CallbackQuery, session: AsyncSession, bot
         # Извлекаем ID приза из callback_data
         prize_id = int(callback.data.split("_")[3])
         
-        # Получаем информацию о призе с блокировкой строки
-        # FOR UPDATE блокирует строку от изменений другими транзакциями
-        prize_result = await session.execute(
-            select(Prize)
-            .where(Prize.id == prize_id)
-            .with_for_update(skip_locked=True)  # skip_locked=True позволяет пропустить уже заблокированные строки
-        )
-        prize = prize_result.scalar_one_or_none()
-        
-        if not prize:
-            await callback.answer("❌ Приз не найден или уже обрабатывается другим администратором", show_alert=True)
+        try:
+            # Подтверждаем приз одним атомарным запросом: условие по статусу
+            # исключает гонку между администраторами без блокировки строки,
+            # а RETURNING сразу отдает данные приза и победителя
+            # (UPDATE ... FROM users) для уведомлений
+            prize = (await session.execute(
+                update(Prize)
+                .where(
+                    Prize.id == prize_id,
+                    Prize.status == "PENDING",
+                    User.id == Prize.user_id
+                )
+                .values(
+                    status="CONFIRMED",
+                    confirmed_at=func.now(),
+                    confirmed_by=user.id  # ID администратора, подтвердившего приз
+                )
+                .returning(
+                    Prize.prize_name,
+                    Prize.combination,
+                    Prize.confirmed_at,
+                    User.telegram_id,
+                    User.full_name
+                )
+            )).first()
+            await session.commit()
+        except Exception as e:
+            logger.error(f"Ошибка при сохранении подтверждения приза: {e}")
+            await session.rollback()
+            await callback.answer("❌ Не удалось подтвердить приз. Попробуйте еще раз", show_alert=True)
             return
         
-        # Проверяем, не подтвержден ли уже приз
-        if prize.status != "PENDING":
-            # Если приз уже подтвержден, получаем информацию о том, кто подтвердил
-            if prize.confirmed_by:
-                confirming_admin_result = await session.execute(
-                    select(User).where(User.id == prize.confirmed_by)
-                )
-                confirming_admin = confirming_admin_result.scalar_one_or_none()
+        if prize is None:
+            # Ни одна строка не обновлена: приза нет или он уже обработан.
+            # Только в этом случае читаем приз, чтобы показать, кто его подтвердил
+            processed = await session.get(Prize, prize_id)
+            if not processed:
+                await callback.answer("❌ Приз не найден", show_alert=True)
+            elif processed.confirmed_by:
+                confirming_admin = await session.get(User, processed.confirmed_by)
                 admin_name = confirming_admin.full_name if confirming_admin else "Другой администратор"
                 
                 await callback.answer(
-                    f"❌ Приз уже {prize.status.lower()} администратором {admin_name} "
-                    f"({prize.confirmed_at.strftime('%d.%m.%Y %H:%M')})",
+                    f"❌ Приз уже {processed.status.lower()} администратором {admin_name} "
+                    f"({processed.confirmed_at.strftime('%d.%m.%Y %H:%M')})",
                     show_alert=True
                 )
             else:
-                await callback.answer(f"❌ Приз уже имеет статус {prize.status}", show_alert=True)
-            return
-        
-        # Получаем информацию о победителе
-        winner_result = await session.execute(
-            select(User).where(User.id == prize.user_id)
-        )
-        winner = winner_result.scalar_one_or_none()
-        
-        if not winner:
-            await callback.answer("❌ Пользователь, выигравший приз, не найден", show_alert=True)
-            return
-        
-        # Обновляем статус приза
-        prize.status = "CONFIRMED"
-        prize.confirmed_at = datetime.now()
-        prize.confirmed_by = user.id  # ID администратора, подтвердившего приз
-        
-        try:
-            await session.commit()
-        except Exception as e:
-            logger.error(f"Ошибка при сохранении подтверждения приза: {e}")
-            await session.rollback()
-            await callback.answer("❌ Не удалось подтвердить приз. Попробуйте еще раз", show_alert=True)
+                await callback.answer(f"❌ Приз уже имеет статус {processed.status}", show_alert=True)
             return
         
         # Отправляем уведомление пользователю
@@ -998,53 +948,72 @@ async def confirm_slot_prize(callback: CallbackQuery, session: AsyncSession, bot
             f"<i>Приз действителен в течение 30 дней.</i>"
         )
         
-        try:
-            await bot.send_message(
-                chat_id=winner.telegram_id,
+        # Победителя уведомляем сразу после фиксации подтверждения,
+        # не дожидаясь подготовки сообщений для администраторов
+        winner_task = asyncio.create_task(
+            bot.send_message(
+                chat_id=prize.telegram_id,
                 text=user_notification,
                 parse_mode=ParseMode.HTML
             )
-        except Exception as e:
-            logger.error(f"Ошибка при отправке уведомления победителю: {e}")
-            # Не прерываем процесс, так как приз уже подтвержден
-        
-        # Обновляем сообщение администратора
-        admin_notification = (
-            f"✅ <b>Приз подтвержден!</b>\n\n"
-            f"👤 Игрок: {winner.full_name}\n"
-            f"🆔 ID: {winner.telegram_id}\n"
-            f"🎁 Приз: {prize.prize_name}\n"
-            f"🎰 Комбинация: {prize.combination}\n"
-            f"📅 Подтверждено: {prize.confirmed_at.strftime('%d.%m.%Y %H:%M')}\n"
-            f"👨‍💼 Подтвердил: {user.full_name}"
         )
         
-        # Обновляем сообщение с новой клавиатурой
-        admin_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text="💬 Написать победителю",
-                    url=f"tg://user?id={winner.telegram_id}"
-                )
-            ]
-        ])
-        
-        # Обновляем все сообщения с этим призом у всех администраторов
-        for admin_id in settings.admin_ids:
+        try:
+            # Обновляем сообщение администратора
+            admin_notification = (
+                f"✅ <b>Приз подтвержден!</b>\n\n"
+                f"👤 Игрок: {prize.full_name}\n"
+                f"🆔 ID: {prize.telegram_id}\n"
+                f"🎁 Приз: {prize.prize_name}\n"
+                f"🎰 Комбинация: {prize.combination}\n"
+                f"📅 Подтверждено: {prize.confirmed_at.strftime('%d.%m.%Y %H:%M')}\n"
+                f"👨‍💼 Подтвердил: {user.full_name}"
+            )
+            
+            # Обновляем сообщение с новой клавиатурой
+            admin_keyboard = InlineKeyboardMarkup(inline_keyboard=[
+                [
+                    InlineKeyboardButton(
+                        text="💬 Написать победителю",
+                        url=f"tg://user?id={prize.telegram_id}"
+                    )
+                ]
+            ])
+            
+            admin_ids = settings.admin_ids
+            
+            # Отвечаем на нажатие, пока уведомления отправляются
+            await callback.answer("✅ Приз успешно подтвержден!", show_alert=True)
+            
+            # Обновляем сообщения с этим призом у администраторов,
+            # пока отправляется уведомление победителю
+            message_id = callback.message.message_id
+            edit_results = await asyncio.gather(
+                *(
+                    bot.edit_message_text(
+                        chat_id=admin_id,
+                        message_id=message_id,
+                        text=admin_notification,
+                        reply_markup=admin_keyboard,
+                        parse_mode=ParseMode.HTML
+                    )
+                    for admin_id in admin_ids
+                ),
+                return_exceptions=True
+            )
+            
+            # Ошибки отправки не прерывают процесс, так как приз уже подтвержден
+            for admin_id, result in zip(admin_ids, edit_results):
+                if isinstance(result, Exception):
+                    logger.error("Ошибка при обновлении сообщения у администратора {}: {}", admin_id, result)
+        finally:
+            # Дожидаемся уведомления победителя, даже если ответ на нажатие
+            # или обновление сообщений завершились ошибкой, чтобы ошибка
+            # отправки была залогирована, а не потеряна вместе с задачей
             try:
-                # Пытаемся обновить сообщение у каждого администратора
-                await bot.edit_message_text(
-                    chat_id=admin_id,
-                    message_id=callback.message.message_id,
-                    text=admin_notification,
-                    reply_markup=admin_keyboard,
-                    parse_mode=ParseMode.HTML
-                )
+                await winner_task
             except Exception as e:
-                logger.error(f"Ошибка при обновлении сообщения у администратора {admin_id}: {e}")
-                continue
-        
-        await callback.answer("✅ Приз успешно подтвержден!", show_alert=True)
+                logger.error("Ошибка при отправке уведомления победителю: {}", e)
         
     except Exception as e:
         logger.error(f"Ошибка при подтверждении приза: {e}")
@@ -1,5 +1,6 @@
 # src/keyboards/admin/admin.py
 
+from functools import lru_cache
 from typing import List
 from datetime import datetime
 
@@ -9,7 +10,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Клавиатуры без параметров создаются один раз и переиспользуются:
+# вызывающий код не должен изменять возвращаемые объекты
 
+# Кнопки клавиатур, которые строятся из данных БД на каждый запрос, создаются
+# через model_construct: данные формируются самим ботом, поэтому проверка
+# Pydantic при создании объектов не нужна
+
+
+@lru_cache(maxsize=1)
 def get_admin_keyboard() -> ReplyKeyboardMarkup:
     """
     Создает основную клавиатуру администратора (Reply клавиатура)
@@ -24,6 +33,7 @@ def get_admin_keyboard() -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=keyboard, resize_keyboard=True)
 
 
+@lru_cache(maxsize=1)
 def get_admin_inline_keyboard() -> InlineKeyboardMarkup:
     """
     Создает inline-клавиатуру для админ-панели
@@ -49,17 +59,20 @@ def get_admin_inline_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+_SERVICES_MANAGEMENT_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="📋 Все услуги", callback_data="view_all_services")],
+    [InlineKeyboardButton(text="➕ Добавить услугу", callback_data="add_service")],
+    [InlineKeyboardButton(text="📁 Архив услуг", callback_data="view_archived_services")],
+    [InlineKeyboardButton(text="↩️ Назад", callback_data="back_to_admin")]
+])
+
+
 def get_services_management_keyboard(services: list) -> InlineKeyboardMarkup:
     """
     Клавиатура управления услугами
     """
-    keyboard = [
-        [InlineKeyboardButton(text="📋 Все услуги", callback_data="view_all_services")],
-        [InlineKeyboardButton(text="➕ Добавить услугу", callback_data="add_service")],
-        [InlineKeyboardButton(text="📁 Архив услуг", callback_data="view_archived_services")],
-        [InlineKeyboardButton(text="↩️ Назад", callback_data="back_to_admin")]
-    ]
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    # Клавиатура не зависит от списка услуг, поэтому создается один раз
+    return _SERVICES_MANAGEMENT_KEYBOARD
 
 
 def get_service_view_keyboard(service_id: int) -> InlineKeyboardMarkup:
@@ -76,60 +89,25 @@ def get_service_view_keyboard(service_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-def get_time_slots_dates_keyboard(time_slots: list, page: int = 1) -> InlineKeyboardMarkup:
+def get_time_slots_dates_keyboard(dates: list, page: int = 1, total_pages: int = 1) -> InlineKeyboardMarkup:
     """
-    Создает клавиатуру с уникальными датами, на которые есть слоты
+    Создает клавиатуру с датами, на которые есть слоты
     С пагинацией по 6 дат на странице (2 столбца по 3 кнопки)
-    """
-    keyboard = []
-    
-    # Фильтруем слоты, начиная с текущей даты
-    current_date = datetime.now().date()
-    filtered_slots = [slot for slot in time_slots if slot.date.date() >= current_date]
-    
-    # Группируем слоты по датам и сортируем их
-    dates = {}
-    for slot in filtered_slots:
-        date_str = slot.date.strftime('%d.%m.%Y')
-        slot_date = slot.date.date()  # Сохраняем дату для сортировки
-        if date_str not in dates:
-            dates[date_str] = {'count': 1, 'date': slot_date}
-        else:
-            dates[date_str]['count'] += 1
-    
-    # Сортируем даты по возрастанию
-    sorted_dates = sorted(dates.items(), key=lambda x: x[1]['date'])
-    
-    # Настройки пагинации
-    items_per_page = 6  # 2 столбца по 3 кнопки
-    total_pages = (len(sorted_dates) + items_per_page - 1) // items_per_page
-    
-    # Проверяем валидность номера страницы
-    if page < 1:
-        page = 1
-    elif page > total_pages:
-        page = total_pages if total_pages > 0 else 1
-    
-    # Вычисляем индексы для текущей страницы
-    start_idx = (page - 1) * items_per_page
-    end_idx = min(start_idx + items_per_page, len(sorted_dates))
     
-    # Добавляем кнопки с датами для текущей страницы
-    current_page_dates = sorted_dates[start_idx:end_idx]
-    temp_row = []
+    dates - строки (day, slots_count) только для текущей страницы,
+    уже сгруппированные и отсортированные в запросе к БД
+    (см. core.utils.time_slots.get_slot_dates_page)
+    """
+    builder = InlineKeyboardBuilder()
     
-    for date_str, date_info in current_page_dates:
-        callback_data = f"view_date_{date_str}"
-        button = InlineKeyboardButton(
-            text=f"📅 {date_str}\n({date_info['count']} сл.)",
-            callback_data=callback_data
+    # Добавляем кнопки с датами для текущей страницы по 2 в строке
+    for day, slots_count in dates:
+        date_str = day.strftime('%d.%m.%Y')
+        builder.button(
+            text=f"📅 {date_str}\n({slots_count} сл.)",
+            callback_data=f"view_date_{date_str}"
         )
-        temp_row.append(button)
-        
-        # Если в строке 2 кнопки или это последняя дата, добавляем строку в клавиатуру
-        if len(temp_row) == 2 or date_str == current_page_dates[-1][0]:
-            keyboard.append(temp_row)
-            temp_row = []
+    builder.adjust(2)
     
     # Добавляем кнопки навигации
     nav_buttons = []
@@ -152,12 +130,12 @@ def get_time_slots_dates_keyboard(time_slots: list, page: int = 1) -> InlineKeyb
                 callback_data=f"date_page_{page+1}"
             ))
             
-        keyboard.append(nav_buttons)
+        builder.row(*nav_buttons)
     
     # Добавляем кнопку "Назад"
-    keyboard.append([InlineKeyboardButton(text="↩️ Назад", callback_data="back_to_admin")])
+    builder.row(InlineKeyboardButton(text="↩️ Назад", callback_data="back_to_admin"))
     
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return builder.as_markup()
 
 
 def get_time_slots_for_date_keyboard(time_slots: list, date_str: str) -> InlineKeyboardMarkup:
@@ -166,22 +144,25 @@ def get_time_slots_for_date_keyboard(time_slots: list, date_str: str) -> InlineK
     """
     keyboard = []
     
+    # Строка с датой разбирается один раз, а слоты сравниваются по дате без форматирования
+    target_date = datetime.strptime(date_str, '%d.%m.%Y').date()
+    
     # Добавляем временные слоты
     for slot in time_slots:
-        if slot.date.strftime('%d.%m.%Y') == date_str:
+        if slot.date.date() == target_date:
             keyboard.append([
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text=f"🕐 {slot.date.strftime('%H:%M')}",
                     callback_data=f"view_slot_{slot.id}"
                 ),
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text="❌",
                     callback_data=f"delete_slot_{slot.id}"
                 )
             ])
     
-    keyboard.append([InlineKeyboardButton(text="↩️ Назад к датам", callback_data="admin_back_to_dates")])
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    keyboard.append([InlineKeyboardButton.model_construct(text="↩️ Назад к датам", callback_data="admin_back_to_dates")])
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=keyboard)
 
 
 def get_appointments_management_keyboard(appointments: list) -> InlineKeyboardMarkup:
@@ -192,7 +173,7 @@ def get_appointments_management_keyboard(appointments: list) -> InlineKeyboardMa
     for appointment in appointments:
         keyboard.extend([
             [
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text=(
                         f"{appointment.user.full_name} - "
                         f"{appointment.service.name} - "
@@ -202,19 +183,19 @@ def get_appointments_management_keyboard(appointments: list) -> InlineKeyboardMa
                 )
             ],
             [
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text="✅ Подтвердить",
                     callback_data=f"confirm_appointment_{appointment.id}"
                 ),
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text="❌ Отменить",
                     callback_data=f"cancel_appointment_{appointment.id}"
                 )
             ]
         ])
     
-    keyboard.append([InlineKeyboardButton(text="↩️ Назад", callback_data="back_to_admin")])
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    keyboard.append([InlineKeyboardButton.model_construct(text="↩️ Назад", callback_data="back_to_admin")])
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=keyboard)
 
 
 def get_news_management_keyboard(news_items: list) -> InlineKeyboardMarkup:
@@ -262,6 +243,7 @@ def get_news_management_keyboard(news_items: list) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_content_management_keyboard() -> InlineKeyboardMarkup:
     """
     Клавиатура управления контентом
@@ -311,6 +293,7 @@ def get_broadcast_management_keyboard(broadcasts: list = None) -> InlineKeyboard
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_broadcast_audience_keyboard() -> InlineKeyboardMarkup:
     """
     Возвращает клавиатуру для выбора аудитории рассылки
@@ -328,6 +311,7 @@ def get_broadcast_audience_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_skip_image_keyboard() -> ReplyKeyboardMarkup:
     """
     Возвращает клавиатуру с кнопкой "Пропустить" для пропуска загрузки изображения
@@ -339,6 +323,8 @@ def get_skip_image_keyboard() -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=keyboard, resize_keyboard=True, one_time_keyboard=True)
 
 
+# Набор действий для подтверждения ограничен, клавиатура кэшируется для каждого
+@lru_cache(maxsize=128)
 def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
     """
     Клавиатура для подтверждения действия
@@ -360,6 +346,7 @@ def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=1)
 def get_service_edit_keyboard() -> InlineKeyboardMarkup:
     """
     Клавиатура выбора поля для редактирования услуги
@@ -381,6 +368,7 @@ def get_service_edit_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_back_to_edit_keyboard() -> InlineKeyboardMarkup:
     """
     Создает клавиатуру с кнопкой возврата к редактированию
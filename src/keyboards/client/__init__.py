@@ -7,11 +7,17 @@ from .client import (
     get_time_slots_keyboard,
     get_profile_keyboard
 )
+from .callbacks import RateCB, ServiceCB, PriceCB, PrizePageCB, ShowPrizeCB
 
 __all__ = [
     "get_main_keyboard",
     "get_contact_keyboard",
     "get_services_keyboard",
     "get_time_slots_keyboard",
-    "get_profile_keyboard"
+    "get_profile_keyboard",
+    "RateCB",
+    "ServiceCB",
+    "PriceCB",
+    "PrizePageCB",
+    "ShowPrizeCB"
 ] 
\ No newline at end of file
@@ -0,0 +1,39 @@
+# src/keyboards/client/callbacks.py
+
+from aiogram.filters.callback_data import CallbackData
+
+
+class RateCB(CallbackData, prefix="rs"):
+    """
+    Оценка услуги клиентом после завершения записи
+    """
+    appointment_id: int
+    rating: int
+
+
+class ServiceCB(CallbackData, prefix="ss"):
+    """
+    Выбор услуги в меню «Услуги и цены»
+    """
+    service_id: int
+
+
+class PriceCB(CallbackData, prefix="rp"):
+    """
+    Запрос расчета стоимости выбранной услуги
+    """
+    service_id: int
+
+
+class PrizePageCB(CallbackData, prefix="pp"):
+    """
+    Страница списка призов пользователя
+    """
+    page: int
+
+
+class ShowPrizeCB(CallbackData, prefix="sp"):
+    """
+    Просмотр информации о выигранном призе
+    """
+    prize_id: int
@@ -1,11 +1,24 @@
 # src/keyboards/client/client.py
 
+from collections import defaultdict
+from functools import lru_cache
+
 from aiogram.types import ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 from typing import List
 from datetime import datetime
 
 from database.models import TimeSlot, Service
+from .callbacks import ServiceCB
+
+# Статические клавиатуры создаются один раз и переиспользуются:
+# вызывающий код не должен изменять возвращаемые объекты
+
+# Кнопки клавиатур, которые строятся из данных БД на каждый запрос, создаются
+# через model_construct: данные формируются самим ботом, поэтому проверка
+# Pydantic при создании объектов не нужна
 
+@lru_cache(maxsize=1)
 def get_main_keyboard() -> ReplyKeyboardMarkup:
     """
     Главная клавиатура
@@ -29,6 +42,7 @@ def get_main_keyboard() -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=keyboard, resize_keyboard=True)
 
 
+@lru_cache(maxsize=1)
 def get_contact_keyboard() -> ReplyKeyboardMarkup:
     """
     Клавиатура для отправки контакта
@@ -46,43 +60,42 @@ def get_services_keyboard(services: List[Service]) -> InlineKeyboardMarkup:
     # Добавляем кнопки для каждой услуги
     for service in services:
         keyboard.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=f"{service.name} - от {service.price}₽",
-                callback_data=f"appointment_select_service_{service.id}"
+                callback_data=ServiceCB(service_id=service.id).pack()
             )
         ])
     
     # # Добавляем кнопку возврата в главное меню
     # keyboard.append([
-    #     InlineKeyboardButton(text="🔙 Главное меню", callback_data="back_to_main")
+    #     InlineKeyboardButton.model_construct(text="🔙 Главное меню", callback_data="back_to_main")
     # ])
     
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=keyboard)
 
 
 def get_time_slots_keyboard(time_slots: List[TimeSlot], page: int = 1) -> InlineKeyboardMarkup:
     """
     Создает клавиатуру с доступными временными слотами
     С пагинацией по 6 слотов на странице (2 столбца по 3 кнопки)
-    """
-    keyboard = []
-    
-    # Фильтруем слоты, начиная с текущей даты
-    current_date = datetime.now().date()
-    filtered_slots = [slot for slot in time_slots if slot.date.date() >= current_date and slot.is_available]
     
-    # Группируем слоты по датам
-    dates = {}
-    for slot in filtered_slots:
-        date_str = slot.date.strftime('%d.%m.%Y')
-        slot_date = slot.date.date()
-        if date_str not in dates:
-            dates[date_str] = {'slots': [slot], 'date': slot_date}
-        else:
-            dates[date_str]['slots'].append(slot)
-    
-    # Сортируем даты по возрастанию
-    sorted_dates = sorted(dates.items(), key=lambda x: x[1]['date'])
+    Слоты должны быть уже отфильтрованы (свободные, начиная с текущего
+    момента) и отсортированы по дате в запросе к БД
+    """
+    builder = InlineKeyboardBuilder()
+    
+    # Группируем слоты по датам за один проход. Слоты уже отсортированы,
+    # поэтому даты в словаре идут по возрастанию, первый слот даты - самый
+    # ранний, а последний - самый поздний
+    dates = defaultdict(lambda: {'count': 0, 'min': None, 'max': None})
+    for slot in time_slots:
+        date_str, time_str = slot.date.strftime('%d.%m.%Y %H:%M').split()
+        date_info = dates[date_str]
+        if date_info['min'] is None:
+            date_info['min'] = time_str
+        date_info['max'] = time_str
+        date_info['count'] += 1
+    sorted_dates = list(dates.items())
     
     # Настройки пагинации
     items_per_page = 6  # 2 столбца по 3 кнопки
@@ -98,54 +111,43 @@ def get_time_slots_keyboard(time_slots: List[TimeSlot], page: int = 1) -> Inline
     start_idx = (page - 1) * items_per_page
     end_idx = min(start_idx + items_per_page, len(sorted_dates))
     
-    # Добавляем кнопки с датами для текущей страницы
-    current_page_dates = sorted_dates[start_idx:end_idx]
-    temp_row = []
-    
-    for date_str, date_info in current_page_dates:
-        slots = date_info['slots']
-        earliest_slot = min(slots, key=lambda x: x.date.time())
-        latest_slot = max(slots, key=lambda x: x.date.time())
-        time_range = f"{earliest_slot.date.strftime('%H:%M')}-{latest_slot.date.strftime('%H:%M')}"
+    # Добавляем кнопки с датами для текущей страницы по 2 в строке
+    for date_str, date_info in sorted_dates[start_idx:end_idx]:
+        time_range = f"{date_info['min']}-{date_info['max']}"
         
-        button = InlineKeyboardButton(
-            text=f"📅 {date_str}\n({time_range}, {len(slots)} сл.)",
+        builder.add(InlineKeyboardButton.model_construct(
+            text=f"📅 {date_str}\n({time_range}, {date_info['count']} сл.)",
             callback_data=f"select_date_{date_str}"
-        )
-        temp_row.append(button)
-        
-        # Если в строке 2 кнопки или это последняя дата, добавляем строку в клавиатуру
-        if len(temp_row) == 2 or date_str == current_page_dates[-1][0]:
-            keyboard.append(temp_row)
-            temp_row = []
+        ))
+    builder.adjust(2)
     
     # Добавляем кнопки навигации
     nav_buttons = []
     
     if total_pages > 1:
         if page > 1:
-            nav_buttons.append(InlineKeyboardButton(
+            nav_buttons.append(InlineKeyboardButton.model_construct(
                 text="⬅️",
                 callback_data=f"client_date_page_{page-1}"
             ))
             
-        nav_buttons.append(InlineKeyboardButton(
+        nav_buttons.append(InlineKeyboardButton.model_construct(
             text=f"📄 {page}/{total_pages}",
             callback_data="ignore"
         ))
         
         if page < total_pages:
-            nav_buttons.append(InlineKeyboardButton(
+            nav_buttons.append(InlineKeyboardButton.model_construct(
                 text="➡️",
                 callback_data=f"client_date_page_{page+1}"
             ))
             
-        keyboard.append(nav_buttons)
+        builder.row(*nav_buttons)
     
     # Добавляем кнопку "Назад"
-    keyboard.append([InlineKeyboardButton(text="↩️ Вернуться в главное меню", callback_data="back_to_main")])
+    builder.row(InlineKeyboardButton.model_construct(text="↩️ Вернуться в главное меню", callback_data="back_to_main"))
     
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return builder.as_markup()
 
 
 def get_time_slots_for_date_keyboard(time_slots: List[TimeSlot], date_str: str) -> InlineKeyboardMarkup:
@@ -154,26 +156,29 @@ def get_time_slots_for_date_keyboard(time_slots: List[TimeSlot], date_str: str)
     """
     keyboard = []
     
-    # Фильтруем и сортируем слоты для выбранной даты
+    # Фильтруем и сортируем слоты для выбранной даты: строка с датой
+    # разбирается один раз, а слоты сравниваются по дате без форматирования
+    target_date = datetime.strptime(date_str, '%d.%m.%Y').date()
     date_slots = [
         slot for slot in time_slots 
-        if slot.date.strftime('%d.%m.%Y') == date_str and slot.is_available
+        if slot.is_available and slot.date.date() == target_date
     ]
     date_slots.sort(key=lambda x: x.date.time())
     
     # Добавляем временные слоты
     for slot in date_slots:
         keyboard.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=f"🕐 {slot.date.strftime('%H:%M')}",
                 callback_data=f"select_time_{slot.id}"
             )
         ])
     
-    keyboard.append([InlineKeyboardButton(text="↩️ Назад к датам", callback_data="client_back_to_dates")])
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    keyboard.append([InlineKeyboardButton.model_construct(text="↩️ Назад к датам", callback_data="client_back_to_dates")])
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=2)
 def get_profile_keyboard(has_active_appointments: bool = False) -> InlineKeyboardMarkup:
     """
     Клавиатура личного кабинета
@@ -2,58 +2,68 @@
 Клавиатуры для слот-машины
 """
 
-from aiogram.utils.keyboard import InlineKeyboardBuilder, ReplyKeyboardBuilder
-from aiogram.types import InlineKeyboardButton, KeyboardButton
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, KeyboardButton, ReplyKeyboardMarkup
 from core.utils.subscription import CHANNEL_ID
+from .callbacks import ShowPrizeCB
+
+# URL канала без символа @ (CHANNEL_ID не меняется за время работы процесса)
+_CHANNEL_URL = "https://t.me/" + CHANNEL_ID.replace("@", "")
+
+# Значки статусов призов в списке призов пользователя
+_STATUS_EMOJI: Final[Mapping[str, str]] = MappingProxyType({
+    "PENDING": "⏳",
+    "CONFIRMED": "✅",
+    "REJECTED": "❌",
+    "USED": "🎉"
+})
 
+# Упакованные callback_data просмотра приза: список призов пользователя
+# открывается повторно, поэтому одни и те же ID упаковываются многократно
+@lru_cache(maxsize=1024)
+def _show_prize_callback(prize_id: int) -> str:
+    return ShowPrizeCB(prize_id=prize_id).pack()
+
+# Клавиатуры без аргументов создаются один раз и переиспользуются:
+# вызывающий код не должен изменять возвращаемые объекты
+@lru_cache(maxsize=1)
 def get_slot_machine_keyboard():
     """
     Клавиатура с кнопкой запуска слот-машины
     
     Returns:
-        InlineKeyboardBuilder: Клавиатура
+        InlineKeyboardMarkup: Клавиатура
     """
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="🎰 Крутить барабан", callback_data="spin_slot")
-    )
-    
-    builder.row(
-        InlineKeyboardButton(text="📊 Мои рефералы", callback_data="show_referrals"),
-        InlineKeyboardButton(text="❓ Правила", callback_data="slot_rules")
-    )
-    
-    builder.row(
-        InlineKeyboardButton(text="🏆 Мои призы", callback_data="my_prizes")
-    )
-    
-    builder.row(
-        InlineKeyboardButton(text="👥 Пригласить друзей", callback_data="invite_friends")
-    )
-    
-    builder.row(
-        InlineKeyboardButton(text="🔙 Вернуться в меню", callback_data="back_to_main")
-    )
-    
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="🎰 Крутить барабан", callback_data="spin_slot")],
+        [
+            InlineKeyboardButton(text="📊 Мои рефералы", callback_data="show_referrals"),
+            InlineKeyboardButton(text="❓ Правила", callback_data="slot_rules")
+        ],
+        [InlineKeyboardButton(text="🏆 Мои призы", callback_data="my_prizes")],
+        [InlineKeyboardButton(text="👥 Пригласить друзей", callback_data="invite_friends")],
+        [InlineKeyboardButton(text="🔙 Вернуться в меню", callback_data="back_to_main")]
+    ])
 
+@lru_cache(maxsize=1)
 def get_main_menu_with_slots_button():
     """
     Добавляет кнопку слот-машины в главное меню
     
     Returns:
-        ReplyKeyboardBuilder: Клавиатура
+        ReplyKeyboardMarkup: Клавиатура
     """
-    builder = ReplyKeyboardBuilder()
-    
     # Основные кнопки меню (предполагается, что они уже существуют в других модулях)
-    builder.row(
-        KeyboardButton(text="🎰 Слот-машина")
+    return ReplyKeyboardMarkup(
+        keyboard=[[KeyboardButton(text="🎰 Слот-машина")]],
+        resize_keyboard=True
     )
-    
-    return builder.as_markup(resize_keyboard=True)
 
+# Название канала меняется редко, кэшируем клавиатуру для каждого варианта
+@lru_cache(maxsize=8)
 def get_subscription_keyboard(channel_name: str):
     """
     Клавиатура с кнопкой подписки на канал
@@ -62,22 +72,12 @@ def get_subscription_keyboard(channel_name: str):
         channel_name: Название канала
         
     Returns:
-        InlineKeyboardBuilder: Клавиатура
+        InlineKeyboardMarkup: Клавиатура
     """
-    builder = InlineKeyboardBuilder()
-    
-    # Используем правильный URL-адрес канала без символа @
-    channel_url = "https://t.me/" + CHANNEL_ID.replace("@", "")
-    
-    builder.row(
-        InlineKeyboardButton(text=f"📢 Подписаться на {channel_name}", url=channel_url)
-    )
-    
-    builder.row(
-        InlineKeyboardButton(text="✅ Я подписался", callback_data="check_subscription")
-    )
-    
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=f"📢 Подписаться на {channel_name}", url=_CHANNEL_URL)],
+        [InlineKeyboardButton(text="✅ Я подписался", callback_data="check_subscription")]
+    ])
 
 def get_prize_keyboard(prize_id: int):
     """
@@ -87,19 +87,12 @@ def get_prize_keyboard(prize_id: int):
         prize_id: ID приза
         
     Returns:
-        InlineKeyboardBuilder: Клавиатура
+        InlineKeyboardMarkup: Клавиатура
     """
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="📋 Информация о призе", callback_data=f"prize_info_{prize_id}")
-    )
-    
-    builder.row(
-        InlineKeyboardButton(text="🔙 Назад к призам", callback_data="my_prizes")
-    )
-    
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="📋 Информация о призе", callback_data=f"prize_info_{prize_id}")],
+        [InlineKeyboardButton(text="🔙 Назад к призам", callback_data="my_prizes")]
+    ])
 
 def get_prizes_list_keyboard(prizes_data):
     """
@@ -109,30 +102,21 @@ def get_prizes_list_keyboard(prizes_data):
         prizes_data: Список призов [(id, name, status), ...]
         
     Returns:
-        InlineKeyboardBuilder: Клавиатура
+        InlineKeyboardMarkup: Клавиатура
     """
-    builder = InlineKeyboardBuilder()
-    
-    # Добавляем кнопки для каждого приза
-    for prize_id, prize_name, status in prizes_data:
-        # Добавляем статус к названию приза
-        status_emoji = {
-            "PENDING": "⏳",
-            "CONFIRMED": "✅",
-            "REJECTED": "❌",
-            "USED": "🎉"
-        }.get(status, "❓")
-        
-        builder.row(
-            InlineKeyboardButton(text=f"{status_emoji} {prize_name}", callback_data=f"show_prize_{prize_id}")
-        )
+    # По кнопке на каждый приз, к названию добавляется значок статуса
+    rows = [
+        [InlineKeyboardButton(
+            text=f"{_STATUS_EMOJI.get(status, '❓')} {prize_name}",
+            callback_data=_show_prize_callback(prize_id)
+        )]
+        for prize_id, prize_name, status in prizes_data
+    ]
     
     # Кнопка возврата в меню
-    builder.row(
-        InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_menu")
-    )
+    rows.append([InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_menu")])
     
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 def get_win_celebration_keyboard(prize_id: int):
     """
@@ -142,17 +126,12 @@ def get_win_celebration_keyboard(prize_id: int):
         prize_id: ID приза
         
     Returns:
-        InlineKeyboardBuilder: Клавиатура
+        InlineKeyboardMarkup: Клавиатура
     """
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="🏆 Информация о призе", callback_data=f"show_prize_{prize_id}")
-    )
-    
-    builder.row(
-        InlineKeyboardButton(text="🎰 Играть снова", callback_data="spin_slot"),
-        InlineKeyboardButton(text="🔙 В меню", callback_data="back_to_menu")
-    )
-    
-    return builder.as_markup() 
\ No newline at end of file
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="🏆 Информация о призе", callback_data=_show_prize_callback(prize_id))],
+        [
+            InlineKeyboardButton(text="🎰 Играть снова", callback_data="spin_slot"),
+            InlineKeyboardButton(text="🔙 В меню", callback_data="back_to_menu")
+        ]
+    ]) 
\ No newline at end of file
@@ -37,12 +37,9 @@ class TimeSlotStates(StatesGroup):
 
 class AdminAppointmentStates(StatesGroup):
     """Состояния для управления записями администратором"""
-    viewing_appointments = State()  # Просмотр списка записей
-    viewing_details = State()      # Просмотр деталей записи
     setting_appointment_price = State()  # Установка цены для записи
     setting_admin_response = State()  # Установка ответа администратора
     adding_appointment_comment = State()  # Добавление комментария к записи
-    confirming_appointment = State()    # Подтверждение записи
     cancelling_appointment = State()    # Отмена записи
     editing_appointment = State()      # Редактирование записи
     entering_appointment_id = State()  # Ввод ID записи для редактирования